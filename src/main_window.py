@@ -341,7 +341,7 @@ class MainWindow(QMainWindow):
         elif come_from == "property_editor":
             self.controller_view.set_node(open_node)
         elif come_from == "controller_view":
-            self.property_editor.update_ui_from_node()
+            self.property_editor.sync_node_changes()
 
     @Slot()
     def on_properties_changed(self):
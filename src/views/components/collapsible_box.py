@@ -1,13 +1,35 @@
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, Signal, Slot
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QToolButton, QLabel, QFormLayout
 
 
 class CollapsibleBox(QWidget):
     """可折叠的属性分组组件 - 性能优化版"""
 
+    # 展开/收起状态变化
+    expanded_changed = Signal(bool)
+
+    # 标题栏和表单行的样式，每个分组只设置一次，不再逐个控件设置
+    STYLE = """
+        QWidget#CollapsibleBoxHeader {
+            background-color: #f0f0f0;
+            border-radius: 3px;
+        }
+        QToolButton#CollapsibleBoxToggle {
+            border: none;
+            background: transparent;
+        }
+        QLabel#CollapsibleBoxTitle {
+            font-weight: bold;
+        }
+        QWidget#CollapsibleBoxContent > QLabel {
+            padding-left: 5px;
+        }
+    """
+
     def __init__(self, title="", parent=None):
         super().__init__(parent)
         self.setObjectName("collapsible_box")
+        self.setStyleSheet(self.STYLE)
 
         # Create main layout
         self.main_layout = QVBoxLayout(self)
@@ -16,32 +38,29 @@ class CollapsibleBox(QWidget):
 
         # Create header
         header = QWidget()
+        header.setObjectName("CollapsibleBoxHeader")
         header.setCursor(Qt.PointingHandCursor)
         header.setMinimumHeight(30)
-        header.setStyleSheet("background-color: #f0f0f0; border-radius: 3px;")
 
         header_layout = QHBoxLayout(header)
         header_layout.setContentsMargins(5, 2, 5, 2)
 
         self.toggle_button = QToolButton()
-        self.toggle_button.setStyleSheet("QToolButton { border: none; background: transparent; }")
+        self.toggle_button.setObjectName("CollapsibleBoxToggle")
         self.toggle_button.setArrowType(Qt.RightArrow)
         self.toggle_button.setCheckable(True)
         self.toggle_button.setChecked(False)
 
         title_label = QLabel(title)
-        title_label.setStyleSheet("font-weight: bold;")
+        title_label.setObjectName("CollapsibleBoxTitle")
 
         header_layout.addWidget(self.toggle_button)
         header_layout.addWidget(title_label)
         header_layout.addStretch()
 
         # Content area
-        self.content_area = QWidget()
+        self.content_area, self.content_layout = self._create_content_area()
         self.content_area.setVisible(False)
-        self.content_layout = QFormLayout(self.content_area)
-        self.content_layout.setContentsMargins(20, 5, 5, 5)
-        self.content_layout.setSpacing(7)
 
         # Add to main layout
         self.main_layout.addWidget(header)
@@ -51,26 +70,41 @@ class CollapsibleBox(QWidget):
         header.mousePressEvent = self.header_clicked
         self.toggle_button.clicked.connect(self.toggle_content)
 
-        # Animation setup
-        self.animation = None
+    def _create_content_area(self):
+        """创建内容区域及其表单布局"""
+        content_area = QWidget()
+        content_area.setObjectName("CollapsibleBoxContent")
+        content_layout = QFormLayout(content_area)
+        content_layout.setContentsMargins(20, 5, 5, 5)
+        content_layout.setSpacing(7)
+        return content_area, content_layout
 
     def header_clicked(self, event):
         self.toggle_button.setChecked(not self.toggle_button.isChecked())
         self.toggle_content()
 
+    @Slot()
     def toggle_content(self):
-        # Use QTimer to defer layout update for better performance
-        self.toggle_button.setArrowType(Qt.DownArrow if self.toggle_button.isChecked() else Qt.RightArrow)
-        QTimer.singleShot(10, lambda: self.content_area.setVisible(self.toggle_button.isChecked()))
+        expanded = self.toggle_button.isChecked()
+        self.toggle_button.setArrowType(Qt.DownArrow if expanded else Qt.RightArrow)
+        self.content_area.setVisible(expanded)
+        self.expanded_changed.emit(expanded)
 
     def set_expanded(self, expanded):
         """设置是否展开此区域"""
         if not isinstance(expanded, bool):
             return
-        if self.toggle_button.isChecked() != expanded and expanded:
-            self.toggle_button.setChecked(expanded)
-            self.toggle_button.setArrowType(Qt.DownArrow if expanded else Qt.RightArrow)
-            self.content_area.setVisible(expanded)
+        # 只会展开，不会自动收起；已经展开时不再重复设置
+        if not expanded or self.toggle_button.isChecked():
+            return
+        self.toggle_button.setChecked(True)
+        self.toggle_button.setArrowType(Qt.DownArrow)
+        self.content_area.setVisible(True)
+        self.expanded_changed.emit(True)
+
+    def is_expanded(self):
+        """是否已展开"""
+        return self.toggle_button.isChecked()
 
     def has_content(self):
         """检查是否有内容"""
@@ -78,13 +112,18 @@ class CollapsibleBox(QWidget):
 
     def add_row(self, label: str, widget: QWidget):
         """添加表单行"""
-        label_widget = QLabel(label)
-        label_widget.setStyleSheet("padding-left: 5px;")
-        self.content_layout.addRow(label_widget, widget)
+        # 标签由QFormLayout创建，样式由STYLE中的子控件选择器设置
+        self.content_layout.addRow(label, widget)
 
     def clear_content(self):
         """清除所有内容"""
-        while self.content_layout.count():
-            item = self.content_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        # 已经是空的内容区域直接复用，不做替换
+        if not self.has_content():
+            return
+
+        # 整体替换内容区域，只触发一次布局更新，而不是逐行移除
+        old_area = self.content_area
+        self.content_area, self.content_layout = self._create_content_area()
+        self.content_area.setVisible(self.toggle_button.isChecked())
+        self.main_layout.replaceWidget(old_area, self.content_area)
+        old_area.deleteLater()
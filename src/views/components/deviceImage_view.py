@@ -154,8 +154,10 @@ class DeviceImageView(QGraphicsView):
             # Center the scene
             self.centerOn(self.pixmap_item)
 
-            # Update scene rect
-            margin = 50  # Extra margin for panning
+            # Update scene rect, margin is expressed in screen pixels so it
+            # stays the same visual size whatever the fitted zoom level is
+            pixel_margin = 50  # Extra margin for panning
+            margin = pixel_margin / max(self.transform().m11(), 1e-6)
             scene_rect = pixmap_rect.adjusted(
                 -margin, -margin, margin, margin
             )
@@ -2,7 +2,7 @@ import sys
 from PySide6.QtWidgets import (QApplication, QWidget, QScrollArea, QGridLayout,
                                QLabel, QPushButton, QFileDialog, QFrame, QVBoxLayout)
 from PySide6.QtGui import QPixmap, QIcon
-from PySide6.QtCore import Qt, QSize, Signal, QTimer
+from PySide6.QtCore import Qt, QSize, Signal, QTimer, Slot
 
 
 class ImagePreviewContainer(QScrollArea):
@@ -53,6 +53,7 @@ class ImagePreviewContainer(QScrollArea):
         # 使用定时器减少频繁调整
         self.resize_timer.start(100)
 
+    @Slot()
     def handle_resize(self):
         """处理容器大小变化，调整所有图片容器的大小"""
         container_width = self.viewport().width()
@@ -67,6 +68,7 @@ class ImagePreviewContainer(QScrollArea):
         add_container.add_clicked.connect(self.add_image)
         self.image_containers.append(add_container)
 
+    @Slot()
     def add_image(self, image_path=None, relative_path=None):
         """添加新图片到容器，可以指定图片路径或通过对话框选择"""
         if not image_path:
@@ -101,6 +103,7 @@ class ImagePreviewContainer(QScrollArea):
             return image_container
         return None
 
+    @Slot(object)
     def delete_image(self, container):
         """删除图片容器"""
         if container in self.image_containers:
@@ -249,6 +252,7 @@ class ImageContainer(QFrame):
         else:
             self.image_label.setText("图片加载失败")
 
+    @Slot()
     def on_delete_clicked(self):
         """删除按钮点击事件"""
         self.delete_clicked.emit(self)
@@ -0,0 +1,88 @@
+from PySide6.QtCore import QSignalBlocker, QStringListModel, QCoreApplication
+from PySide6.QtWidgets import QComboBox
+
+
+class LazyComboBox(QComboBox):
+    """延迟填充的下拉框 - 首次显示或按下标访问时才创建选项，选项在创建时固定"""
+
+    # 选项列表 -> 共享的数据模型，选项相同的下拉框共用同一个模型
+    _shared_models = {}
+
+    def __init__(self, items=None, parent=None):
+        super().__init__(parent)
+        self._pending_items = list(items or [])
+        # 文本 -> 下标，按文本查找时无需逐项比较
+        self._index_of = {text: index for index, text in enumerate(self._pending_items)}
+        # 选项未创建前记录当前选中的文本
+        self._pending_text = self._pending_items[0] if self._pending_items else ""
+
+    def is_populated(self):
+        """选项是否已经创建"""
+        return self._pending_items is None
+
+    def ensure_items(self):
+        """创建选项并恢复之前记录的当前文本"""
+        if self._pending_items is None:
+            return
+
+        items, self._pending_items = tuple(self._pending_items), None
+        blocker = QSignalBlocker(self)
+        try:
+            self.setModel(self._shared_model(items))
+            index = self._index_of.get(self._pending_text, -1)
+            if index >= 0:
+                super().setCurrentIndex(index)
+        finally:
+            blocker.unblock()
+
+    @classmethod
+    def _shared_model(cls, items):
+        """获取选项对应的共享模型，模型归应用程序所有"""
+        model = cls._shared_models.get(items)
+        if model is None:
+            model = QStringListModel(list(items), QCoreApplication.instance())
+            cls._shared_models[items] = model
+        return model
+
+    def set_current_text(self, text):
+        """按文本选中选项，未创建选项时只记录文本"""
+        index = self._index_of.get(text, -1)
+        if self._pending_items is None:
+            if index >= 0:
+                super().setCurrentIndex(index)
+            return
+
+        if index < 0 or text == self._pending_text:
+            return
+        self._pending_text = text
+        self.currentTextChanged.emit(text)
+
+    def setCurrentText(self, text):
+        self.set_current_text(text)
+
+    def currentText(self):
+        if self._pending_items is not None:
+            return self._pending_text
+        return super().currentText()
+
+    def currentIndex(self):
+        self.ensure_items()
+        return super().currentIndex()
+
+    def setCurrentIndex(self, index):
+        self.ensure_items()
+        super().setCurrentIndex(index)
+
+    def findText(self, text, *args):
+        if not args:
+            return self._index_of.get(text, -1)
+        self.ensure_items()
+        return super().findText(text, *args)
+
+    def count(self):
+        self.ensure_items()
+        return super().count()
+
+    def showEvent(self, event):
+        self.ensure_items()
+        super().showEvent(event)
@@ -1,5 +1,6 @@
-from PySide6.QtCore import Signal
-from PySide6.QtWidgets import (QWidget, QVBoxLayout, QPushButton, QTextEdit, QHBoxLayout)
+from PySide6.QtCore import Signal, QSignalBlocker, QTimer, Slot
+from PySide6.QtGui import QTextCursor
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QToolButton, QPlainTextEdit, QHBoxLayout)
 
 
 class ListEditor(QWidget):
@@ -7,54 +8,42 @@ class ListEditor(QWidget):
 
     value_changed = Signal(list)
 
+    # 所有实例共用的样式表，设置在编辑器本身上，由子控件继承
+    # 文本框的样式与其他多行输入框相同，由属性编辑器的样式表统一设置
+    STYLE = """
+        QToolButton {
+            padding: 3px 10px;
+            background-color: #f8f8f8;
+            border-radius: 3px;
+            border: 1px solid #ccc;
+        }
+        QToolButton:hover {
+            background-color: #e8e8e8;
+        }
+    """
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(0, 0, 0, 0)
         self.layout.setSpacing(3)
+        self.setStyleSheet(self.STYLE)
 
         # 列表项显示区域
-        self.text_edit = QTextEdit()
+        self.text_edit = QPlainTextEdit()
         self.text_edit.setPlaceholderText("每行输入一个值")
         self.text_edit.setMaximumHeight(80)
-        self.text_edit.setStyleSheet("""
-            QTextEdit {
-                border: 1px solid #ccc;
-                border-radius: 3px;
-                padding: 2px;
-            }
-        """)
 
         # 按钮区域
         button_layout = QHBoxLayout()
         button_layout.setSpacing(5)
 
-        self.add_btn = QPushButton("添加项")
-        self.add_btn.setStyleSheet("""
-            QPushButton {
-                padding: 3px 10px;
-                background-color: #f8f8f8;
-                border-radius: 3px;
-                border: 1px solid #ccc;
-            }
-            QPushButton:hover {
-                background-color: #e8e8e8;
-            }
-        """)
-
-        self.clear_btn = QPushButton("清空")
-        self.clear_btn.setStyleSheet("""
-            QPushButton {
-                padding: 3px 10px;
-                background-color: #f8f8f8;
-                border-radius: 3px;
-                border: 1px solid #ccc;
-            }
-            QPushButton:hover {
-                background-color: #e8e8e8;
-            }
-        """)
+        self.add_btn = QToolButton()
+        self.add_btn.setText("添加项")
+
+        self.clear_btn = QToolButton()
+        self.clear_btn.setText("清空")
 
         button_layout.addWidget(self.add_btn)
         button_layout.addWidget(self.clear_btn)
@@ -69,37 +58,98 @@ class ListEditor(QWidget):
         self.text_edit.textChanged.connect(self.on_text_changed)
 
         self._value = []
-
+        # 上次解析过的文本，文本未变化时无需重新解析
+        self._last_text = None
+        # 正在插入空行，文本变化不影响列表的值
+        self._inserting = False
+
+        # 输入时合并多次变化，停止输入后再统一解析
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(200)
+        self._debounce.timeout.connect(self._recompute)
+
+    @Slot()
     def add_item(self):
         """添加新项"""
-        self.text_edit.append("")
+        # 在末尾插入一个空行，空行不会改变列表的值，因此不需要重新解析
+        cursor = self.text_edit.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        if not self.text_edit.document().isEmpty():
+            self._inserting = True
+            try:
+                cursor.insertText("\n")
+            finally:
+                self._inserting = False
+        self.text_edit.setTextCursor(cursor)
         self.text_edit.setFocus()
 
+    @Slot()
     def clear_items(self):
         """清空所有项"""
         self.text_edit.clear()
+        self._debounce.stop()
+        self._last_text = None
+        if not self._value:
+            return
         self._value = []
         self.value_changed.emit(self._value)
 
+    @Slot()
     def on_text_changed(self):
-        """文本内容变化时更新值"""
+        """文本内容变化时延迟更新值"""
+        if self._inserting:
+            return
+        self._debounce.start()
+
+    @Slot()
+    def _recompute(self):
+        """解析文本内容，值有变化时才发出信号"""
+        self._debounce.stop()
         text = self.text_edit.toPlainText()
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
+        if text == self._last_text:
+            return
+        self._last_text = text
+        lines = list(filter(None, map(str.strip, text.splitlines())))
+        if lines == self._value:
+            return
         self._value = lines
         self.value_changed.emit(self._value)
 
     def set_value(self, value):
-        """设置编辑器的值"""
+        """设置编辑器的值，程序设置的值不会经过延迟解析再回传为value_changed"""
         if isinstance(value, list):
-            self._value = value
-            self.text_edit.setText('\n'.join([str(item) for item in value]))
+            text = '\n'.join(map(str, value))
         elif isinstance(value, str):
-            self._value = [value]
-            self.text_edit.setText(value)
+            value, text = [value], value
         else:
-            self._value = []
-            self.text_edit.clear()
+            value, text = [], ""
+        # 值相同且没有待解析的输入时，文本已经一致，无需读取和比较文档内容
+        if value == self._value and text == self._last_text and not self._debounce.isActive():
+            return
+        self._value = value
+        # 文本未变化时不重新设置，避免文档重新排版
+        if text != self.text_edit.toPlainText():
+            self.text_edit.setPlainText(text)
+        # 文本与值已经一致，丢弃由setPlainText触发的延迟解析
+        self._debounce.stop()
+        self._last_text = text
+
+    def set_value_silently(self, value):
+        """设置编辑器的值，不发出value_changed信号"""
+        blocker = QSignalBlocker(self.text_edit)
+        try:
+            self.set_value(value)
+        finally:
+            blocker.unblock()
+
+    def flush(self):
+        """立即解析尚未处理的输入"""
+        if self._debounce.isActive():
+            self._recompute()
 
     def get_value(self):
         """获取编辑器的值"""
+        # 保证取到最新的值
+        self.flush()
         return self._value
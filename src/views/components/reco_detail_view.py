@@ -103,6 +103,9 @@ class RecoDetailView(QWidget):
     # 获取详情信号
     fetch_detail_signal = Signal(int)
 
+    # "无图片"标签的样式，标签会反复重建，共用同一个样式字符串
+    NO_IMAGES_STYLE = "font-size: 14pt; color: #888888; padding: 20px;"
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -151,10 +154,7 @@ class RecoDetailView(QWidget):
         self.image_scroll.setWidget(self.image_container)
 
         # 默认"无图片"标签
-        self.no_images_label = QLabel("None")
-        self.no_images_label.setAlignment(Qt.AlignCenter)
-        self.no_images_label.setStyleSheet("font-size: 14pt; color: #888888; padding: 20px;")
-        self.image_layout.addWidget(self.no_images_label)
+        self.add_no_images_label()
 
         # 右侧：占位框架（不实现数据显示部分）
         self.right_frame = QFrame()
@@ -227,10 +227,7 @@ class RecoDetailView(QWidget):
                 item.widget().deleteLater()
 
         # 添加回"无图片"标签
-        self.no_images_label = QLabel("None")
-        self.no_images_label.setAlignment(Qt.AlignCenter)
-        self.no_images_label.setStyleSheet("font-size: 14pt; color: #888888; padding: 20px;")
-        self.image_layout.addWidget(self.no_images_label)
+        self.add_no_images_label()
 
         # 隐藏加载指示器
         self.loading_frame.hide()
@@ -238,6 +235,13 @@ class RecoDetailView(QWidget):
         # 清除图片缓存
         self._image_cache.clear()
 
+    def add_no_images_label(self):
+        """在图片区域添加"无图片"标签"""
+        self.no_images_label = QLabel("None")
+        self.no_images_label.setAlignment(Qt.AlignCenter)
+        self.no_images_label.setStyleSheet(self.NO_IMAGES_STYLE)
+        self.image_layout.addWidget(self.no_images_label)
+
     def update_details(self, reco_id: int):
         """更新特定识别ID的详情"""
         self.current_reco_id = reco_id
@@ -317,10 +321,7 @@ class RecoDetailView(QWidget):
             self._load_images(details.draw_images)
         else:
             # 添加回"无图片"标签
-            self.no_images_label = QLabel("None")
-            self.no_images_label.setAlignment(Qt.AlignCenter)
-            self.no_images_label.setStyleSheet("font-size: 14pt; color: #888888; padding: 20px;")
-            self.image_layout.addWidget(self.no_images_label)
+            self.add_no_images_label()
 
     def _update_detail_table(self, raw_detail):
         """更新详细数据表格"""
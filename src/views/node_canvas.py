@@ -407,7 +407,7 @@ class NodeCanvas(QWidget):
                 self.info_label.setText(f"点击连接到 {node_name} 的 {port_name} 端口")
                 self.view.setCursor(Qt.DragLinkCursor)
             else:
-                if isinstance(item, Node) or isinstance(item, InputPort):
+                if isinstance(item, (Node, InputPort)):
                     self.info_label.setText("无法连接到此节点或端口")
                     self.view.setCursor(Qt.ForbiddenCursor)
                 else:
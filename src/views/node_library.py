@@ -1,4 +1,10 @@
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QListWidget
+from typing import Dict, List, Optional
+
+from PySide6.QtGui import QIcon
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QListWidget, QListWidgetItem
+
+from src.pipeline import TaskNode
+from src.views.node_system.node import Node
 
 
 class NodeLibrary(QWidget):
@@ -6,20 +12,28 @@ class NodeLibrary(QWidget):
         super().__init__(parent)
 
         layout = QVBoxLayout(self)
+        self.setStyleSheet("QLabel#NodeLibraryTitle { font-weight: bold; font-size: 14px; }")
 
         # 创建标题标签
         title_label = QLabel("节点库")
-        title_label.setStyleSheet("font-weight: bold; font-size: 14px;")
+        title_label.setObjectName("NodeLibraryTitle")
 
         # 创建节点模板列表
         self.template_list = QListWidget()
 
+        # 节点模板数据，按列分开存放（同一下标对应同一个模板），拖拽时只需按下标读取
+        self._names: List[str] = []
+        self._ids: List[str] = []
+        self._mime: List[bytes] = []
+        self._icons: List[QIcon] = []
+        self._id_to_index: Dict[str, int] = {}
+
         # 添加一些示例节点模板
-        self.template_list.addItem("识别节点")
-        self.template_list.addItem("点击节点")
-        self.template_list.addItem("滑动节点")
-        self.template_list.addItem("等待节点")
-        self.template_list.addItem("条件节点")
+        self.add_template(TaskNode("识别节点", recognition="TemplateMatch"))
+        self.add_template(TaskNode("点击节点", action="Click"))
+        self.add_template(TaskNode("滑动节点", action="Swipe"))
+        self.add_template(TaskNode("等待节点"))
+        self.add_template(TaskNode("条件节点"))
 
         # 创建提示标签
         info_label = QLabel("拖拽节点到画布")
@@ -29,14 +43,37 @@ class NodeLibrary(QWidget):
         layout.addWidget(self.template_list)
         layout.addWidget(info_label)
 
-        # 节点模板列表
-        self.templates = []
+    def add_template(self, template: TaskNode, icon: Optional[QIcon] = None):
+        """添加节点模板，模板ID为节点名称"""
+        template_id = template.name
+        if template_id in self._id_to_index:
+            return
 
-    def add_template(self, template):
-        pass
+        icon = icon or QIcon()
+        self._id_to_index[template_id] = len(self._ids)
+        self._names.append(template.name)
+        self._ids.append(template_id)
+        self._mime.append(template.to_json().encode("utf-8"))
+        self._icons.append(icon)
+
+        self.template_list.addItem(QListWidgetItem(icon, template.name))
 
     def get_templates(self):
-        pass
+        """获取所有模板的 (ID, 名称) 列表"""
+        return list(zip(self._ids, self._names))
+
+    def get_template_mime(self, template_id) -> Optional[bytes]:
+        """获取模板的拖拽数据"""
+        index = self._id_to_index.get(template_id)
+        return self._mime[index] if index is not None else None
 
     def create_node_from_template(self, template_id):
-        pass
\ No newline at end of file
+        """根据模板ID创建新节点"""
+        index = self._id_to_index.get(template_id)
+        if index is None:
+            return None
+
+        task_node = TaskNode.from_json(self._mime[index].decode("utf-8"))
+        node = Node(title=task_node.name)
+        node.set_task_node(task_node)
+        return node
@@ -1,24 +1,57 @@
 import json
 import os
+import re
+from contextlib import contextmanager
 from typing import Dict, Any, Optional, List, Tuple
 
-from PySide6.QtCore import Signal, QTimer, Slot, QRectF
-from PySide6.QtGui import QTextCursor, QFont, Qt
+from PySide6.QtCore import Signal, QTimer, QElapsedTimer, Slot, QSignalBlocker, QRegularExpression, QCoreApplication
+from PySide6.QtGui import QFont, Qt, QRegularExpressionValidator
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QFormLayout,
                                QLineEdit, QSpinBox, QPushButton, QCheckBox,
-                               QComboBox, QTextEdit, QDoubleSpinBox, QHBoxLayout,
-                               QScrollArea, QFrame, QMessageBox,
-                               QTabWidget, QStackedWidget)
+                               QComboBox, QPlainTextEdit, QDoubleSpinBox, QHBoxLayout,
+                               QScrollArea, QTabWidget, QStackedWidget)
 
 from src.config_manager import config_manager
 from src.pipeline import TaskNode
 from src.views.components.collapsible_box import CollapsibleBox
+from src.views.components.lazy_combo_box import LazyComboBox
 from src.views.components.list_editor import ListEditor
-from src.views.components.image_preview_container import ImagePreviewContainer, ImageContainer
+from src.views.components.image_preview_container import ImagePreviewContainer
+
+
+# 坐标 [x,y,w,h]
+_COORD_RE = re.compile(r'^\[\s*(-?\d+)\s*,\s*(-?\d+)\s*,\s*(-?\d+)\s*,\s*(-?\d+)\s*\]$')
+# 整数
+_INT_RE = re.compile(r'[+-]?\d+')
+
+
+# 表示"使用自身识别结果"的关键字
+_SELF_POSITION_KEYWORDS = frozenset({"target", "begin", "end"})
+
+# 属性定义中重复使用的占位文本和选项
+_COORD_PLACEHOLDER = "[x,y,w,h]"
+_NODE_OR_COORD_PLACEHOLDER = "节点名或坐标 [x,y,w,h]"
+_TARGET_PLACEHOLDER = "节点名或坐标 [x,y,w,h],不填写则为识别目标"
+_TEMPLATE_PLACEHOLDER = "模板图片路径，相对于image文件夹"
+_COLOR_PLACEHOLDER = "[R,G,B] 或 [[R,G,B],[R,G,B],...]"
+_EXPECTED_INDEX_PLACEHOLDER = "0 或 [0, 1, 2]"
+_LABELS_PLACEHOLDER = '["猫", "狗", "鼠"]'
+_JSON_PARAM_PLACEHOLDER = "JSON格式参数"
+_ORDER_BY_ITEMS = ("Horizontal", "Vertical", "Score", "Area", "Random")
+_DETECTOR_ITEMS = ("SIFT", "KAZE", "AKAZE", "BRISK", "ORB")
+
+
+def _parse_coord4(text: str) -> Optional[List[int]]:
+    """解析 [x,y,w,h] 格式的坐标，格式不符时返回None"""
+    match = _COORD_RE.match(text)
+    if match is None:
+        return None
+    return list(map(int, match.groups()))
 
 
 class PropertyConfig:
     """属性配置类"""
+    __slots__ = ("widget_type", "label", "kwargs")
 
     def __init__(self, widget_type: str, label: str = "", **kwargs):
         self.widget_type = widget_type
@@ -26,36 +59,235 @@ class PropertyConfig:
         self.kwargs = kwargs
 
 
+# 列表/字典值的格式化器，json.dumps带参数调用时每次都会新建编码器
+_LINE_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+_BLOCK_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2)
+
+
+def _set_line_edit_value(widget: QLineEdit, value: Any):
+    if isinstance(value, (list, dict)):
+        widget.setText(_LINE_JSON_ENCODER.encode(value))
+    elif value is True:
+        # 对于target, begin, end等特殊值，True表示使用默认值
+        widget.clear()
+    else:
+        widget.setText(str(value) if value is not None else "")
+
+
+def _set_text_edit_value(widget: QPlainTextEdit, value: Any):
+    if isinstance(value, (list, dict)):
+        widget.setPlainText(_BLOCK_JSON_ENCODER.encode(value))
+    else:
+        widget.setPlainText(str(value) if value is not None else "")
+
+
+def _set_spin_box_value(widget, value: Any):
+    if value is not None:
+        widget.setValue(value)
+
+
+def _set_combo_box_value(widget: QComboBox, value: Any):
+    if value:
+        index = widget.findText(str(value))
+        if index >= 0:
+            widget.setCurrentIndex(index)
+
+
+def _set_lazy_combo_box_value(widget: LazyComboBox, value: Any):
+    if value:
+        widget.set_current_text(str(value))
+
+
+def _set_check_box_value(widget: QCheckBox, value: Any):
+    widget.setChecked(bool(value))
+
+
+def _set_list_editor_value(widget: ListEditor, value: Any):
+    widget.set_value_silently(value or [])
+
+
+# 控件类型 -> 赋值函数
+_WIDGET_SETTERS = {
+    QLineEdit: _set_line_edit_value,
+    QPlainTextEdit: _set_text_edit_value,
+    QSpinBox: _set_spin_box_value,
+    QDoubleSpinBox: _set_spin_box_value,
+    QComboBox: _set_combo_box_value,
+    LazyComboBox: _set_lazy_combo_box_value,
+    QCheckBox: _set_check_box_value,
+    ListEditor: _set_list_editor_value,
+}
+
+
+def _get_line_edit_value(widget: QLineEdit) -> Any:
+    text = widget.text().strip()
+    if not text:
+        return None
+
+    # 处理特殊值(target, begin, end)
+    if text in _SELF_POSITION_KEYWORDS:
+        return True
+
+    # 坐标是最常见的输入，先尝试直接解析
+    coord = _parse_coord4(text)
+    if coord is not None:
+        return coord
+
+    if text.startswith(("[", "{")):
+        try:
+            return json.loads(text)
+        except ValueError:
+            return text
+
+    # 先匹配再转换为整数，节点名、路径等普通文本不再经过异常
+    if _INT_RE.fullmatch(text):
+        return int(text)
+    return text
+
+
+def _get_text_edit_value(widget: QPlainTextEdit) -> Any:
+    text = widget.toPlainText().strip()
+    if not text:
+        return None
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text  # 如果JSON解析失败，返回原始文本而不是None
+
+
+# 控件类型 -> 取值函数
+_WIDGET_GETTERS = {
+    QLineEdit: _get_line_edit_value,
+    QPlainTextEdit: _get_text_edit_value,
+    QSpinBox: QSpinBox.value,
+    QDoubleSpinBox: QDoubleSpinBox.value,
+    QComboBox: QComboBox.currentText,
+    LazyComboBox: LazyComboBox.currentText,
+    QCheckBox: QCheckBox.isChecked,
+    ListEditor: ListEditor.get_value,
+}
+
+
+# 只接受 [x,y,w,h] 的输入框共用的校验器，首次使用时创建
+_coord_validator: Optional[QRegularExpressionValidator] = None
+
+
+def _create_line_edit(kwargs: Dict[str, Any]) -> QLineEdit:
+    global _coord_validator
+    widget = QLineEdit()
+    # 偏移量等只能填写坐标的输入框，限制输入格式
+    if kwargs.get("placeholder") == _COORD_PLACEHOLDER:
+        if _coord_validator is None:
+            _coord_validator = QRegularExpressionValidator(QRegularExpression(_COORD_RE.pattern),
+                                                           QCoreApplication.instance())
+        widget.setValidator(_coord_validator)
+    return widget
+
+
+def _spin_box_creator(spin_type):
+    """数值框的创建函数，范围和步长作为构造参数一次设置"""
+    def create(kwargs: Dict[str, Any]):
+        properties = {}
+        if "range" in kwargs:
+            properties["minimum"], properties["maximum"] = kwargs["range"]
+        if "step" in kwargs:
+            properties["singleStep"] = kwargs["step"]
+        return spin_type(**properties)
+    return create
+
+
+def _create_combo_box(kwargs: Dict[str, Any]) -> QComboBox:
+    widget = QComboBox()
+    widget.addItems(kwargs.get("items", ()))
+    return widget
+
+
+# 控件类型名 -> (创建函数, 值变化信号名)，创建函数接收属性配置的参数
+_WIDGET_FACTORIES = {
+    "QLineEdit": (_create_line_edit, "textChanged"),
+    "QPlainTextEdit": (lambda kwargs: QPlainTextEdit(), "textChanged"),
+    "QSpinBox": (_spin_box_creator(QSpinBox), "valueChanged"),
+    "QDoubleSpinBox": (_spin_box_creator(QDoubleSpinBox), "valueChanged"),
+    "QComboBox": (_create_combo_box, "currentTextChanged"),
+    # 选项在首次显示时才创建
+    "LazyComboBox": (lambda kwargs: LazyComboBox(kwargs.get("items")), "currentTextChanged"),
+    "QCheckBox": (lambda kwargs: QCheckBox(), "toggled"),
+    "ListEditor": (lambda kwargs: ListEditor(), "value_changed"),
+}
+
+# 属性配置参数 -> 控件方法名
+_WIDGET_OPTIONS = (
+    ("placeholder", "setPlaceholderText"),
+    ("tooltip", "setToolTip"),
+    ("max_height", "setMaximumHeight"),
+)
+
+
+def _lookup_widget_handler(table: Dict[type, Any], widget: QWidget):
+    """按控件的类型查找处理函数，未登记的子类沿MRO解析一次后缓存到表中"""
+    widget_type = type(widget)
+    try:
+        return table[widget_type]
+    except KeyError:
+        handler = next((table[base] for base in widget_type.__mro__[1:] if base in table), None)
+        table[widget_type] = handler
+        return handler
+
+
 class NodePropertiesEditor(QWidget):
     """节点属性编辑器"""
     OpenNodeChanged = Signal(str,object)
 
     # node_changed = Signal(object)
     node_name_change = Signal(str, str)
-    # 样式常量
+    # 样式常量，全部合并后设置在编辑器上，由子控件按类型/对象名匹配
     STYLES = {
+        "editor": """
+            QLabel#PropertyEditorTitle {
+                font-weight: bold;
+                font-size: 14px;
+                color: #333;
+            }
+            QLabel#PropertyEditorStatus {
+                color: #2e7d32;
+            }
+            QLabel#PropertyEditorHint {
+                color: #666;
+            }
+            QLabel#PropertyEditorHelp {
+                color: #666;
+                font-style: italic;
+            }
+            QLabel#PropertyEditorError {
+                background-color: #ffdddd;
+                color: #990000;
+                padding: 8px;
+                border-radius: 3px;
+                border: 1px solid #990000;
+            }
+        """,
         "button": """
-            QPushButton {
+            QPushButton#PropertyEditorPrimaryButton {
                 background-color: #4a86e8;
                 color: white;
                 border: none;
                 padding: 5px 15px;
                 border-radius: 3px;
             }
-            QPushButton:hover { background-color: #3a76d8; }
-            QPushButton:pressed { background-color: #2a66c8; }
-            QPushButton:disabled { background-color: #cccccc; }
+            QPushButton#PropertyEditorPrimaryButton:hover { background-color: #3a76d8; }
+            QPushButton#PropertyEditorPrimaryButton:pressed { background-color: #2a66c8; }
+            QPushButton#PropertyEditorPrimaryButton:disabled { background-color: #cccccc; }
         """,
         "reset_button": """
-            QPushButton {
+            QPushButton#PropertyEditorSecondaryButton {
                 background-color: #f8f8f8;
                 color: #333;
                 border: 1px solid #ccc;
                 padding: 5px 15px;
                 border-radius: 3px;
             }
-            QPushButton:hover { background-color: #e8e8e8; }
-            QPushButton:pressed { background-color: #d8d8d8; }
+            QPushButton#PropertyEditorSecondaryButton:hover { background-color: #e8e8e8; }
+            QPushButton#PropertyEditorSecondaryButton:pressed { background-color: #d8d8d8; }
         """,
         "input": """
             QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox {
@@ -66,9 +298,37 @@ class NodePropertiesEditor(QWidget):
             QLineEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus, QComboBox:focus {
                 border: 1px solid #4a86e8;
             }
+        """,
+        "text_input": """
+            QPlainTextEdit {
+                border: 1px solid #ccc;
+                border-radius: 3px;
+                padding: 2px;
+            }
+            QPlainTextEdit:focus {
+                border: 1px solid #4a86e8;
+            }
         """
     }
 
+    # 识别算法和动作类型，所有实例共用
+    RECOGNITION_TYPES = TaskNode.RECOGNITION_TYPES
+    ACTION_TYPES = TaskNode.ACTION_TYPES
+
+    # 识别算法/动作特有属性的切换配置：(所属折叠框, 无需特殊配置的类型, 是否刷新预览)
+    PROPERTY_KINDS = {
+        "recognition": ("识别算法特有属性", frozenset({"DirectHit"}), True),
+        "action": ("执行动作特有属性", frozenset({"DoNothing", "StopTask"}), False),
+    }
+
+    # 不使用通用识别属性(roi/order_by/index等)的识别算法
+    NO_COMMON_RECOGNITIONS = frozenset({"DirectHit", "Custom"})
+    # 需要预览模板图片的识别算法
+    IMAGE_BASED_RECOGNITIONS = frozenset({"TemplateMatch", "FeatureMatch"})
+
+    # 只在界面上单独处理、不按通用方式写回节点的属性
+    UI_ONLY_PROPERTIES = frozenset({"name"})
+
     # 属性定义
     PROPERTY_DEFAULTS = {
         "recognition": "DirectHit",
@@ -123,27 +383,190 @@ class NodePropertiesEditor(QWidget):
         # 可以添加更多算法特定的默认值
     }
 
+    # 通用识别属性（除了DirectHit和Custom外的所有识别算法都需要）
+    _COMMON_RECOGNITION_PROPERTIES = {
+        "roi": PropertyConfig("QLineEdit", "识别区域:", placeholder=_NODE_OR_COORD_PLACEHOLDER),
+        "roi_offset": PropertyConfig("QLineEdit", "区域偏移:", placeholder=_COORD_PLACEHOLDER),
+        "order_by": PropertyConfig("LazyComboBox", "结果排序:",
+                                   items=_ORDER_BY_ITEMS,
+                                   default=PROPERTY_DEFAULTS.get("order_by")),
+        "index": PropertyConfig("QSpinBox", "结果索引:", range=(-100, 100),
+                                default=PROPERTY_DEFAULTS.get("index"))
+    }
+
+    # 识别算法属性，类定义时构建一次，所有实例共用
+    RECOGNITION_PROPERTIES = {
+        "DirectHit": {},
+
+        "TemplateMatch": {
+            **_COMMON_RECOGNITION_PROPERTIES,
+            "template": PropertyConfig("QLineEdit", "模板图片:", placeholder=_TEMPLATE_PLACEHOLDER),
+            "threshold": PropertyConfig("QDoubleSpinBox", "匹配阈值:", range=(0, 1), step=0.1,
+                                        default=ALGORITHM_DEFAULTS["TemplateMatch"]["threshold"]),
+            "method": PropertyConfig("QSpinBox", "匹配算法:", range=(1, 5),
+                                     default=PROPERTY_DEFAULTS.get("method"),
+                                     tooltip="1、3、5分别对应不同的模板匹配算法"),
+            "green_mask": PropertyConfig("QCheckBox", "绿色掩码:",
+                                         default=PROPERTY_DEFAULTS.get("green_mask"),
+                                         tooltip="是否忽略图片中的绿色部分")
+        },
+
+        "FeatureMatch": {
+            **_COMMON_RECOGNITION_PROPERTIES,
+            "template": PropertyConfig("QLineEdit", "模板图片:", placeholder=_TEMPLATE_PLACEHOLDER),
+            "count": PropertyConfig("QSpinBox", "特征点数量:", range=(1, 100),
+                                    default=ALGORITHM_DEFAULTS["FeatureMatch"]["count"]),
+            "detector": PropertyConfig("LazyComboBox", "特征检测器:", items=_DETECTOR_ITEMS,
+                                       default=PROPERTY_DEFAULTS.get("detector")),
+            "ratio": PropertyConfig("QDoubleSpinBox", "距离比值:", range=(0, 1), step=0.1,
+                                    default=PROPERTY_DEFAULTS.get("ratio")),
+            "green_mask": PropertyConfig("QCheckBox", "绿色掩码:",
+                                         default=PROPERTY_DEFAULTS.get("green_mask"))
+        },
+
+        "ColorMatch": {
+            **_COMMON_RECOGNITION_PROPERTIES,
+            "lower": PropertyConfig("QLineEdit", "颜色下限:", placeholder=_COLOR_PLACEHOLDER),
+            "upper": PropertyConfig("QLineEdit", "颜色上限:", placeholder=_COLOR_PLACEHOLDER),
+            "method": PropertyConfig("QSpinBox", "匹配算法:", range=(0, 50),
+                                     default=ALGORITHM_DEFAULTS["ColorMatch"]["method"],  # 使用算法特定的默认值
+                                     tooltip="常用：4(RGB), 40(HSV), 6(灰度)"),
+            "count": PropertyConfig("QSpinBox", "特征点数量:", range=(1, 10000),
+                                    default=ALGORITHM_DEFAULTS["ColorMatch"]["count"]),
+            "connected": PropertyConfig("QCheckBox", "要求相连:",
+                                        default=PROPERTY_DEFAULTS.get("connected"))
+        },
+
+        "OCR": {
+            **_COMMON_RECOGNITION_PROPERTIES,
+            "expected": PropertyConfig("QLineEdit", "期望文本:", placeholder="期望文本或正则表达式"),
+            "threshold": PropertyConfig("QDoubleSpinBox", "匹配阈值:", range=(0, 1), step=0.1,
+                                        default=ALGORITHM_DEFAULTS["OCR"]["threshold"]),
+            "replace": PropertyConfig("QLineEdit", "文本替换:", placeholder='["原文本", "替换文本"]'),
+            "only_rec": PropertyConfig("QCheckBox", "仅识别:",
+                                       default=PROPERTY_DEFAULTS.get("only_rec"),
+                                       tooltip="仅识别，不进行文本检测"),
+            "model": PropertyConfig("QLineEdit", "模型路径:", placeholder="模型文件夹，相对于model/ocr")
+        },
+
+        "NeuralNetworkClassify": {
+            **_COMMON_RECOGNITION_PROPERTIES,
+            "model": PropertyConfig("QLineEdit", "模型路径:", placeholder="模型文件，相对于model/classify"),
+            "expected": PropertyConfig("QLineEdit", "期望文本:", placeholder=_EXPECTED_INDEX_PLACEHOLDER),
+            "labels": PropertyConfig("QLineEdit", "标签列表:", placeholder=_LABELS_PLACEHOLDER)
+        },
+
+        "NeuralNetworkDetect": {
+            **_COMMON_RECOGNITION_PROPERTIES,
+            "model": PropertyConfig("QLineEdit", "模型路径:", placeholder="模型文件，相对于model/detect"),
+            "expected": PropertyConfig("QLineEdit", "期望文本:", placeholder=_EXPECTED_INDEX_PLACEHOLDER),
+            "threshold": PropertyConfig("QDoubleSpinBox", "匹配阈值:", range=(0, 1), step=0.1,
+                                        default=ALGORITHM_DEFAULTS["NeuralNetworkDetect"]["threshold"]),
+            "labels": PropertyConfig("QLineEdit", "标签列表:", placeholder=_LABELS_PLACEHOLDER)
+        },
+
+        "Custom": {
+            "custom_recognition": PropertyConfig("QLineEdit", "自定义识别名:",
+                                                 placeholder="注册的自定义识别器名称"),
+            "custom_recognition_param": PropertyConfig("QPlainTextEdit", "自定义识别参数:",
+                                                       max_height=100, placeholder=_JSON_PARAM_PLACEHOLDER),
+            # Custom只需要roi和roi_offset
+            "roi": _COMMON_RECOGNITION_PROPERTIES["roi"],
+            "roi_offset": _COMMON_RECOGNITION_PROPERTIES["roi_offset"]
+        }
+    }
+
+    # 动作属性
+    ACTION_PROPERTIES = {
+        "DoNothing": {},
+        "StopTask": {},
+
+        "Click": {
+            "target": PropertyConfig("QLineEdit", "点击目标:",
+                                     placeholder=_TARGET_PLACEHOLDER,
+                                     default=PROPERTY_DEFAULTS.get("target")),
+            "target_offset": PropertyConfig("QLineEdit", "目标偏移:", placeholder=_COORD_PLACEHOLDER)
+        },
+
+        "Swipe": {
+            "begin": PropertyConfig("QLineEdit", "起点:", placeholder=_NODE_OR_COORD_PLACEHOLDER,
+                                    default=PROPERTY_DEFAULTS.get("begin")),
+            "begin_offset": PropertyConfig("QLineEdit", "起点偏移:", placeholder=_COORD_PLACEHOLDER),
+            "end": PropertyConfig("QLineEdit", "终点:", placeholder=_NODE_OR_COORD_PLACEHOLDER,
+                                  default=PROPERTY_DEFAULTS.get("end")),
+            "end_offset": PropertyConfig("QLineEdit", "终点偏移:", placeholder=_COORD_PLACEHOLDER),
+            "duration": PropertyConfig("QSpinBox", "持续时间(ms):", range=(50, 5000),
+                                       default=PROPERTY_DEFAULTS.get("duration"))
+        },
+
+        "MultiSwipe": {
+            "swipes": PropertyConfig("QPlainTextEdit", "滑动配置:", max_height=120,
+                                     placeholder='多指滑动配置，JSON格式')
+        },
+
+        "Key": {
+            "key": PropertyConfig("QLineEdit", "按键码:", placeholder="25 或 [25, 26, 27]")
+        },
+
+        "InputText": {
+            "input_text": PropertyConfig("QLineEdit", "输入文本:", placeholder="要输入的文本")
+        },
+
+        "StartApp": {
+            "package": PropertyConfig("QLineEdit", "应用包名:", placeholder="包名或Activity，如com.example.app")
+        },
+
+        "StopApp": {
+            "package": PropertyConfig("QLineEdit", "应用包名:", placeholder="包名，如com.example.app")
+        },
+
+        "Command": {
+            "exec": PropertyConfig("QLineEdit", "执行程序:", placeholder="执行程序路径"),
+            "args": PropertyConfig("QPlainTextEdit", "执行参数:", max_height=80,
+                                   placeholder='["arg1", "arg2", "{NODE}", "{BOX}"]'),
+            "detach": PropertyConfig("QCheckBox", "分离进程:", tooltip="是否分离子进程，不等待完成继续执行",
+                                     default=PROPERTY_DEFAULTS.get("detach"))
+        },
+
+        "Custom": {
+            "custom_action": PropertyConfig("QLineEdit", "自定义动作名:", placeholder="注册的自定义动作名称"),
+            "custom_action_param": PropertyConfig("QPlainTextEdit", "自定义动作参数:",
+                                                  max_height=100, placeholder=_JSON_PARAM_PLACEHOLDER),
+            "target": PropertyConfig("QLineEdit", "点击目标:",
+                                     placeholder=_TARGET_PLACEHOLDER,
+                                     default=PROPERTY_DEFAULTS.get("target")),
+            "target_offset": PropertyConfig("QLineEdit", "目标偏移:", placeholder=_COORD_PLACEHOLDER)
+        }
+    }
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
         self.open_node = None
-        self.recognition_types = [
-            "DirectHit", "TemplateMatch", "FeatureMatch", "ColorMatch",
-            "OCR", "NeuralNetworkClassify", "NeuralNetworkDetect", "Custom"
-        ]
-
-        self.action_types = [
-            "DoNothing", "Click", "Swipe", "MultiSwipe", "Key",
-            "InputText", "StartApp", "StopApp", "StopTask", "Command", "Custom"
-        ]
 
         self.current_node = None
-        self.is_updating_ui = False
+        # 最近一次同步到界面/发出变更时节点的JSON，用于判断节点是否真的发生了变化
+        self.applied_snapshot = None
+        # JSON标签页当前内容对应的节点JSON，节点未变化且内容未被编辑时无需重新格式化
+        self.json_preview_snapshot = None
         self.auto_save = False
         self.visual_node = None
         # 存储所有widget的字典
         self.widgets = {}
-        self.property_widgets = {}
+        # 基本属性控件按控件类型分组，批量读写时每组只需查找一次处理函数
+        self.widget_lanes: Dict[type, List[Tuple[str, QWidget]]] = {}
+        # 算法/动作特有属性，按 (类别, 类型) 缓存，页面在首次使用时才创建
+        self.property_widgets: Dict[Tuple[str, str], Dict[str, QWidget]] = {}
+        self.property_pages: Dict[Tuple[str, str], QWidget] = {}
+        self.property_specs: Dict[str, Dict[str, Dict[str, PropertyConfig]]] = {}
+        # 当前显示页面的属性控件，按类别保存，读写当前类型的属性时无需再按类型查找
+        self.current_property_widgets: Dict[str, Dict[str, QWidget]] = {}
+        # 所属分组折叠时暂不创建的页面：类别 -> 类型，分组展开时再创建并填充
+        self.pending_pages: Dict[str, str] = {}
+        # 切换节点后尚未重置为默认值的页面
+        self.stale_pages = set()
+        # 用户修改过、尚未写回节点的控件，应用更改时只读取这些控件
+        self.dirty_widgets = set()
 
         self.init_ui()
         self.setup_properties()
@@ -152,6 +575,9 @@ class NodePropertiesEditor(QWidget):
 
     def init_ui(self):
         """初始化UI"""
+        # 所有样式统一在这里设置一次，避免逐个控件调用setStyleSheet
+        self.setStyleSheet("".join(self.STYLES.values()))
+
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(10, 10, 10, 10)
 
@@ -196,7 +622,7 @@ class NodePropertiesEditor(QWidget):
 
         # 标题
         title = QLabel("节点属性编辑器")
-        title.setStyleSheet("font-weight: bold; font-size: 14px; color: #333;")
+        title.setObjectName("PropertyEditorTitle")
         layout.addWidget(title)
 
         # 滚动区域
@@ -227,7 +653,7 @@ class NodePropertiesEditor(QWidget):
 
         # 标题
         title = QLabel("节点识别预览")
-        title.setStyleSheet("font-weight: bold; font-size: 14px; color: #333;")
+        title.setObjectName("PropertyEditorTitle")
         layout.addWidget(title)
 
         # 创建图像预览容器
@@ -242,7 +668,7 @@ class NodePropertiesEditor(QWidget):
 
         # 添加说明文本
         help_text = QLabel("此区域显示识别算法使用的模板图片。支持TemplateMatch和FeatureMatch等基于图片的识别算法。")
-        help_text.setStyleSheet("color: #666; font-style: italic;")
+        help_text.setObjectName("PropertyEditorHelp")
         help_text.setWordWrap(True)
         layout.addWidget(help_text)
 
@@ -255,21 +681,13 @@ class NodePropertiesEditor(QWidget):
 
         # 错误提示
         self.json_error_banner = QLabel()
-        self.json_error_banner.setStyleSheet("""
-            QLabel {
-                background-color: #ffdddd;
-                color: #990000;
-                padding: 8px;
-                border-radius: 3px;
-                border: 1px solid #990000;
-            }
-        """)
+        self.json_error_banner.setObjectName("PropertyEditorError")
         self.json_error_banner.setWordWrap(True)
         self.json_error_banner.hide()
         layout.addWidget(self.json_error_banner)
 
         # JSON编辑器
-        self.json_editor = QTextEdit()
+        self.json_editor = QPlainTextEdit()
         font = QFont("Consolas, Courier New, monospace", 11)
         self.json_editor.setFont(font)
         layout.addWidget(self.json_editor, 1)
@@ -277,9 +695,9 @@ class NodePropertiesEditor(QWidget):
         # 按钮
         button_layout = QHBoxLayout()
         self.json_apply_button = QPushButton("应用JSON")
-        self.json_apply_button.setStyleSheet(self.STYLES["button"])
+        self.json_apply_button.setObjectName("PropertyEditorPrimaryButton")
         self.json_reset_button = QPushButton("重置JSON")
-        self.json_reset_button.setStyleSheet(self.STYLES["reset_button"])
+        self.json_reset_button.setObjectName("PropertyEditorSecondaryButton")
 
         button_layout.addStretch()
         button_layout.addWidget(self.json_reset_button)
@@ -310,15 +728,19 @@ class NodePropertiesEditor(QWidget):
 
         configs = {
             "name": PropertyConfig("QLineEdit", "节点名称:", placeholder="输入节点名称"),
-            "recognition": PropertyConfig("QComboBox", "识别算法:",
-                                          items=self.recognition_types,
+            "recognition": PropertyConfig("LazyComboBox", "识别算法:",
+                                          items=self.RECOGNITION_TYPES,
                                           default=self.PROPERTY_DEFAULTS.get("recognition")),
-            "action": PropertyConfig("QComboBox", "执行动作:",
-                                     items=self.action_types,
+            "action": PropertyConfig("LazyComboBox", "执行动作:",
+                                     items=self.ACTION_TYPES,
                                      default=self.PROPERTY_DEFAULTS.get("action"))
         }
 
-        self.add_properties_to_box(box, configs)
+        # 识别算法和动作切换时先切换页面再记录修改，只连接各自的处理函数
+        self.add_properties_to_box(box, configs, {
+            "recognition": self.on_recognition_changed,
+            "action": self.on_action_changed,
+        })
 
     def create_flow_control(self):
         """创建流程控制"""
@@ -389,6 +811,11 @@ class NodePropertiesEditor(QWidget):
         self.action_stack = QStackedWidget()
         action_box.content_layout.addWidget(self.action_stack)
 
+        self.property_stacks = {
+            "recognition": self.recognition_stack,
+            "action": self.action_stack
+        }
+
     def create_box(self, title: str) -> CollapsibleBox:
         """创建可折叠框"""
         box = CollapsibleBox(title)
@@ -396,120 +823,76 @@ class NodePropertiesEditor(QWidget):
         self.scroll_layout.addWidget(box)
         return box
 
-    def add_properties_to_box(self, box: CollapsibleBox, configs: Dict[str, PropertyConfig]):
-        """向框中添加属性"""
+    def add_properties_to_box(self, box: CollapsibleBox, configs: Dict[str, PropertyConfig],
+                              change_handlers: Optional[Dict[str, Any]] = None):
+        """向框中添加属性，change_handlers可为个别属性指定代替on_widget_changed的变化处理函数"""
+        change_handlers = change_handlers or {}
         for prop_name, config in configs.items():
-            widget = self.create_widget(config)
+            widget = self.create_widget(config, change_handlers.get(prop_name))
             self.widgets[prop_name] = widget
+            self.widget_lanes.setdefault(type(widget), []).append((prop_name, widget))
             box.add_row(config.label, widget)
 
-    def create_widget(self, config: PropertyConfig) -> QWidget:
+    def create_widget(self, config: PropertyConfig, on_change=None) -> QWidget:
         """创建widget"""
-        widget_type = config.widget_type
+        factory = _WIDGET_FACTORIES.get(config.widget_type)
+        if factory is None:
+            return None
+
+        create, change_signal = factory
         kwargs = config.kwargs
+        widget = create(kwargs)
 
-        widget = None
-
-        if widget_type == "QLineEdit":
-            widget = QLineEdit()
-            widget.setStyleSheet(self.STYLES["input"])
-            widget.textChanged.connect(self.on_widget_changed)
-            # If default is provided and it's not a boolean True (used for target, begin, end)
-            if "default" in kwargs and kwargs["default"] not in (True, None) and not isinstance(kwargs["default"],
-                                                                                                bool):
-                if isinstance(kwargs["default"], (list, dict)):
-                    widget.setText(json.dumps(kwargs["default"]))
-                else:
-                    widget.setText(str(kwargs["default"]))
-
-        elif widget_type == "QSpinBox":
-            widget = QSpinBox()
-            widget.setStyleSheet(self.STYLES["input"])
-            widget.valueChanged.connect(self.on_widget_changed)
-            if "default" in kwargs and kwargs["default"] is not None:
-                widget.setValue(kwargs["default"])
-
-        elif widget_type == "QDoubleSpinBox":
-            widget = QDoubleSpinBox()
-            widget.setStyleSheet(self.STYLES["input"])
-            widget.valueChanged.connect(self.on_widget_changed)
-            if "default" in kwargs and kwargs["default"] is not None:
-                widget.setValue(kwargs["default"])
-
-        elif widget_type == "QComboBox":
-            widget = QComboBox()
-            widget.setStyleSheet(self.STYLES["input"])
-            widget.currentTextChanged.connect(self.on_widget_changed)
-            # Set items first, then default
-            if "items" in kwargs:
-                widget.addItems(kwargs["items"])
-            if "default" in kwargs and kwargs["default"] is not None:
-                index = widget.findText(str(kwargs["default"]))
-                if index >= 0:
-                    widget.setCurrentIndex(index)
-
-        elif widget_type == "QCheckBox":
-            widget = QCheckBox()
-            widget.toggled.connect(self.on_widget_changed)
-            if "default" in kwargs:
-                widget.setChecked(bool(kwargs["default"]))
-
-        elif widget_type == "ListEditor":
-            widget = ListEditor()
-            widget.value_changed.connect(self.on_widget_changed)
-            if "default" in kwargs and kwargs["default"] is not None:
-                widget.set_value(kwargs["default"])
-
-        elif widget_type == "QTextEdit":
-            widget = QTextEdit()
-            widget.setStyleSheet("""
-                QTextEdit {
-                    border: 1px solid #ccc;
-                    border-radius: 3px;
-                    padding: 2px;
-                }
-                QTextEdit:focus {
-                    border: 1px solid #4a86e8;
-                }
-            """)
-            widget.textChanged.connect(self.on_widget_changed)
-            if "default" in kwargs and kwargs["default"] is not None:
-                if isinstance(kwargs["default"], (list, dict)):
-                    widget.setPlainText(json.dumps(kwargs["default"], indent=2))
-                else:
-                    widget.setPlainText(str(kwargs["default"]))
-
-        # 应用kwargs中的属性
-        if widget:
-            for key, value in kwargs.items():
-                if key == "placeholder" and hasattr(widget, "setPlaceholderText"):
-                    widget.setPlaceholderText(value)
-                elif key == "range" and hasattr(widget, "setRange"):
-                    widget.setRange(*value)
-                elif key == "step" and hasattr(widget, "setSingleStep"):
-                    widget.setSingleStep(value)
-                elif key == "tooltip":
-                    widget.setToolTip(value)
-                elif key == "max_height" and hasattr(widget, "setMaximumHeight"):
-                    widget.setMaximumHeight(value)
+        # 应用kwargs中的属性，数值框的范围已在创建时设置，默认值不会被默认范围截断
+        for key, method_name in _WIDGET_OPTIONS:
+            if key in kwargs and hasattr(widget, method_name):
+                getattr(widget, method_name)(kwargs[key])
+
+        default = kwargs.get("default")
+        if default is not None:
+            self.set_widget_value(widget, default)
 
+        # 默认值设置完成后再连接信号，创建控件不会被当作用户修改
+        getattr(widget, change_signal).connect(on_change or self.on_widget_changed)
         return widget
 
     def create_button_layout(self) -> QHBoxLayout:
         """创建按钮布局"""
         layout = QHBoxLayout()
 
+        # 操作结果提示，显示一段时间后自动清除
+        self.status_label = QLabel()
+        self.status_label.setObjectName("PropertyEditorStatus")
+        self.status_timer = QTimer(self)
+        self.status_timer.setSingleShot(True)
+        self.status_timer.setInterval(2000)
+        self.status_timer.timeout.connect(self.status_label.clear)
+
+        # 自动保存节流：修改后立即保存，间隔内的后续修改在间隔结束时合并保存一次
+        self.auto_save_timer = QTimer(self)
+        self.auto_save_timer.setSingleShot(True)
+        self.auto_save_timer.setInterval(150)
+        self.auto_save_timer.timeout.connect(self.apply_changes_silent)
+        # 距上次保存的时间
+        self.auto_save_clock = QElapsedTimer()
+        # 自动保存后延迟通知其他视图，短时间内的多次保存只刷新一次
+        self.notify_timer = QTimer(self)
+        self.notify_timer.setSingleShot(True)
+        self.notify_timer.setInterval(50)
+        self.notify_timer.timeout.connect(self.notify_node_changed)
+
         self.auto_save_check = QCheckBox("自动保存")
         self.auto_save_check.toggled.connect(self.toggle_auto_save)
 
         self.apply_button = QPushButton("应用更改")
-        self.apply_button.setStyleSheet(self.STYLES["button"])
+        self.apply_button.setObjectName("PropertyEditorPrimaryButton")
         self.apply_button.clicked.connect(self.apply_changes)
 
         self.reset_button = QPushButton("重置")
-        self.reset_button.setStyleSheet(self.STYLES["reset_button"])
+        self.reset_button.setObjectName("PropertyEditorSecondaryButton")
         self.reset_button.clicked.connect(self.reset_form)
 
+        layout.addWidget(self.status_label)
         layout.addStretch()
         layout.addWidget(self.auto_save_check)
         layout.addWidget(self.apply_button)
@@ -519,211 +902,76 @@ class NodePropertiesEditor(QWidget):
 
     def setup_properties(self):
         """设置属性定义"""
-        # 通用识别属性（除了DirectHit和Custom外的所有识别算法都需要）
-        common_recognition = {
-            "roi": PropertyConfig("QLineEdit", "识别区域:", placeholder="节点名或坐标 [x,y,w,h]"),
-            "roi_offset": PropertyConfig("QLineEdit", "区域偏移:", placeholder="[x,y,w,h]"),
-            "order_by": PropertyConfig("QComboBox", "结果排序:",
-                                       items=["Horizontal", "Vertical", "Score", "Area", "Random"],
-                                       default=self.PROPERTY_DEFAULTS.get("order_by")),
-            "index": PropertyConfig("QSpinBox", "结果索引:", range=(-100, 100),
-                                    default=self.PROPERTY_DEFAULTS.get("index"))
+        # 只保存属性定义，具体页面在首次切换到对应类型时才创建
+        self.property_specs = {
+            "recognition": self.RECOGNITION_PROPERTIES,
+            "action": self.ACTION_PROPERTIES
         }
 
-        # 识别算法属性
-        recognition_props = {
-            "DirectHit": {},
-
-            "TemplateMatch": {
-                "template": PropertyConfig("QLineEdit", "模板图片:", placeholder="模板图片路径，相对于image文件夹"),
-                "threshold": PropertyConfig("QDoubleSpinBox", "匹配阈值:", range=(0, 1), step=0.1,
-                                            default=self.ALGORITHM_DEFAULTS["TemplateMatch"]["threshold"]),
-                "method": PropertyConfig("QSpinBox", "匹配算法:", range=(1, 5),
-                                         default=self.PROPERTY_DEFAULTS.get("method"),
-                                         tooltip="1、3、5分别对应不同的模板匹配算法"),
-                "green_mask": PropertyConfig("QCheckBox", "绿色掩码:",
-                                             default=self.PROPERTY_DEFAULTS.get("green_mask"),
-                                             tooltip="是否忽略图片中的绿色部分")
-            },
-
-            "FeatureMatch": {
-                "template": PropertyConfig("QLineEdit", "模板图片:", placeholder="模板图片路径，相对于image文件夹"),
-                "count": PropertyConfig("QSpinBox", "特征点数量:", range=(1, 100),
-                                        default=self.ALGORITHM_DEFAULTS["FeatureMatch"]["count"]),
-                "detector": PropertyConfig("QComboBox", "特征检测器:", items=["SIFT", "KAZE", "AKAZE", "BRISK", "ORB"],
-                                           default=self.PROPERTY_DEFAULTS.get("detector")),
-                "ratio": PropertyConfig("QDoubleSpinBox", "距离比值:", range=(0, 1), step=0.1,
-                                        default=self.PROPERTY_DEFAULTS.get("ratio")),
-                "green_mask": PropertyConfig("QCheckBox", "绿色掩码:",
-                                             default=self.PROPERTY_DEFAULTS.get("green_mask"))
-            },
-
-            "ColorMatch": {
-                "lower": PropertyConfig("QLineEdit", "颜色下限:", placeholder="[R,G,B] 或 [[R,G,B],[R,G,B],...]"),
-                "upper": PropertyConfig("QLineEdit", "颜色上限:", placeholder="[R,G,B] 或 [[R,G,B],[R,G,B],...]"),
-                "method": PropertyConfig("QSpinBox", "匹配算法:", range=(0, 50),
-                                         default=self.ALGORITHM_DEFAULTS["ColorMatch"]["method"],  # 使用算法特定的默认值
-                                         tooltip="常用：4(RGB), 40(HSV), 6(灰度)"),
-                "count": PropertyConfig("QSpinBox", "特征点数量:", range=(1, 10000),
-                                        default=self.ALGORITHM_DEFAULTS["ColorMatch"]["count"]),
-                "connected": PropertyConfig("QCheckBox", "要求相连:",
-                                            default=self.PROPERTY_DEFAULTS.get("connected"))
-            },
-
-            "OCR": {
-                "expected": PropertyConfig("QLineEdit", "期望文本:", placeholder="期望文本或正则表达式"),
-                "threshold": PropertyConfig("QDoubleSpinBox", "匹配阈值:", range=(0, 1), step=0.1,
-                                            default=self.ALGORITHM_DEFAULTS["OCR"]["threshold"]),
-                "replace": PropertyConfig("QLineEdit", "文本替换:", placeholder='["原文本", "替换文本"]'),
-                "only_rec": PropertyConfig("QCheckBox", "仅识别:",
-                                           default=self.PROPERTY_DEFAULTS.get("only_rec"),
-                                           tooltip="仅识别，不进行文本检测"),
-                "model": PropertyConfig("QLineEdit", "模型路径:", placeholder="模型文件夹，相对于model/ocr")
-            },
-
-            "NeuralNetworkClassify": {
-                "model": PropertyConfig("QLineEdit", "模型路径:", placeholder="模型文件，相对于model/classify"),
-                "expected": PropertyConfig("QLineEdit", "期望文本:", placeholder="0 或 [0, 1, 2]"),
-                "labels": PropertyConfig("QLineEdit", "标签列表:", placeholder='["猫", "狗", "鼠"]')
-            },
-
-            "NeuralNetworkDetect": {
-                "model": PropertyConfig("QLineEdit", "模型路径:", placeholder="模型文件，相对于model/detect"),
-                "expected": PropertyConfig("QLineEdit", "期望文本:", placeholder="0 或 [0, 1, 2]"),
-                "threshold": PropertyConfig("QDoubleSpinBox", "匹配阈值:", range=(0, 1), step=0.1,
-                                            default=self.ALGORITHM_DEFAULTS["NeuralNetworkDetect"]["threshold"]),
-                "labels": PropertyConfig("QLineEdit", "标签列表:", placeholder='["猫", "狗", "鼠"]')
-            },
-
-            "Custom": {
-                "custom_recognition": PropertyConfig("QLineEdit", "自定义识别名:",
-                                                     placeholder="注册的自定义识别器名称"),
-                "custom_recognition_param": PropertyConfig("QTextEdit", "自定义识别参数:",
-                                                           max_height=100, placeholder="JSON格式参数")
-            }
-        }
-
-        # 为识别算法添加通用属性
-        for rec_type in recognition_props:
-            if rec_type not in ["DirectHit", "Custom"]:
-                recognition_props[rec_type] = {**common_recognition, **recognition_props[rec_type]}
-            elif rec_type == "Custom":
-                # Custom只需要roi和roi_offset
-                recognition_props[rec_type].update({
-                    "roi": common_recognition["roi"],
-                    "roi_offset": common_recognition["roi_offset"]
-                })
-
-        # 为每个识别算法创建容器
-        for rec_type in self.recognition_types:
-            container = QWidget()
-            layout = QFormLayout(container)
-
-            props = recognition_props.get(rec_type, {})
-            widgets = {}
-
-            if not props:
-                info_label = QLabel(f"{rec_type}无需特殊配置")
-                info_label.setStyleSheet("color: #666;")
-                layout.addRow("", info_label)
-            else:
-                for prop_name, config in props.items():
-                    widget = self.create_widget(config)
-                    widgets[prop_name] = widget
-                    layout.addRow(config.label, widget)
-
-            self.property_widgets[rec_type] = widgets
-            self.recognition_stack.addWidget(container)
-
-        # 动作属性
-        action_props = {
-            "DoNothing": {},
-            "StopTask": {},
-
-            "Click": {
-                "target": PropertyConfig("QLineEdit", "点击目标:",
-                                         placeholder="节点名或坐标 [x,y,w,h],不填写则为识别目标",
-                                         default=self.PROPERTY_DEFAULTS.get("target")),
-                "target_offset": PropertyConfig("QLineEdit", "目标偏移:", placeholder="[x,y,w,h]")
-            },
-
-            "Swipe": {
-                "begin": PropertyConfig("QLineEdit", "起点:", placeholder="节点名或坐标 [x,y,w,h]",
-                                        default=self.PROPERTY_DEFAULTS.get("begin")),
-                "begin_offset": PropertyConfig("QLineEdit", "起点偏移:", placeholder="[x,y,w,h]"),
-                "end": PropertyConfig("QLineEdit", "终点:", placeholder="节点名或坐标 [x,y,w,h]",
-                                      default=self.PROPERTY_DEFAULTS.get("end")),
-                "end_offset": PropertyConfig("QLineEdit", "终点偏移:", placeholder="[x,y,w,h]"),
-                "duration": PropertyConfig("QSpinBox", "持续时间(ms):", range=(50, 5000),
-                                           default=self.PROPERTY_DEFAULTS.get("duration"))
-            },
-
-            "MultiSwipe": {
-                "swipes": PropertyConfig("QTextEdit", "滑动配置:", max_height=120,
-                                         placeholder='多指滑动配置，JSON格式')
-            },
-
-            "Key": {
-                "key": PropertyConfig("QLineEdit", "按键码:", placeholder="25 或 [25, 26, 27]")
-            },
-
-            "InputText": {
-                "input_text": PropertyConfig("QLineEdit", "输入文本:", placeholder="要输入的文本")
-            },
-
-            "StartApp": {
-                "package": PropertyConfig("QLineEdit", "应用包名:", placeholder="包名或Activity，如com.example.app")
-            },
-
-            "StopApp": {
-                "package": PropertyConfig("QLineEdit", "应用包名:", placeholder="包名，如com.example.app")
-            },
-
-            "Command": {
-                "exec": PropertyConfig("QLineEdit", "执行程序:", placeholder="执行程序路径"),
-                "args": PropertyConfig("QTextEdit", "执行参数:", max_height=80,
-                                       placeholder='["arg1", "arg2", "{NODE}", "{BOX}"]'),
-                "detach": PropertyConfig("QCheckBox", "分离进程:", tooltip="是否分离子进程，不等待完成继续执行",
-                                         default=self.PROPERTY_DEFAULTS.get("detach"))
-            },
-
-            "Custom": {
-                "custom_action": PropertyConfig("QLineEdit", "自定义动作名:", placeholder="注册的自定义动作名称"),
-                "custom_action_param": PropertyConfig("QTextEdit", "自定义动作参数:",
-                                                      max_height=100, placeholder="JSON格式参数"),
-                "target": PropertyConfig("QLineEdit", "点击目标:",
-                                         placeholder="节点名或坐标 [x,y,w,h],不填写则为识别目标",
-                                         default=self.PROPERTY_DEFAULTS.get("target")),
-                "target_offset": PropertyConfig("QLineEdit", "目标偏移:", placeholder="[x,y,w,h]")
-            }
-        }
-
-        # 为每个动作创建容器
-        for action_type in self.action_types:
-            container = QWidget()
-            layout = QFormLayout(container)
-
-            props = action_props.get(action_type, {})
-            widgets = {}
-
-            if not props:
-                info_label = QLabel(f"{action_type}无需特殊配置")
-                info_label.setStyleSheet("color: #666;")
-                layout.addRow("", info_label)
-            else:
-                for prop_name, config in props.items():
-                    widget = self.create_widget(config)
-                    widgets[prop_name] = widget
-                    layout.addRow(config.label, widget)
-
-            self.property_widgets[action_type] = widgets
-            self.action_stack.addWidget(container)
+    def get_property_widgets(self, kind: str, algo_type: str) -> Dict[str, QWidget]:
+        """获取识别算法/动作的属性控件，页面不存在时创建并缓存"""
+        widgets = self.property_widgets.get((kind, algo_type))
+        if widgets is None:
+            widgets = self.build_property_page(kind, algo_type)
+        return widgets
+
+    def build_property_page(self, kind: str, algo_type: str) -> Dict[str, QWidget]:
+        """创建识别算法/动作的属性页面并加入对应的堆叠控件"""
+        container = QWidget()
+        layout = QFormLayout(container)
+
+        props = self.property_specs[kind].get(algo_type, {})
+        widgets = {}
+
+        if not props:
+            info_label = QLabel(f"{algo_type}无需特殊配置")
+            info_label.setObjectName("PropertyEditorHint")
+            layout.addRow("", info_label)
+        else:
+            for prop_name, config in props.items():
+                widget = self.create_widget(config)
+                widgets[prop_name] = widget
+                layout.addRow(config.label, widget)
+
+        self.property_widgets[(kind, algo_type)] = widgets
+        self.property_pages[(kind, algo_type)] = container
+
+        # 页面在未挂载时建好，加入堆叠控件期间暂停重绘，只触发一次布局
+        stack = self.property_stacks[kind]
+        pause_updates = stack.updatesEnabled()
+        if pause_updates:
+            stack.setUpdatesEnabled(False)
+        try:
+            stack.addWidget(container)
+        finally:
+            if pause_updates:
+                stack.setUpdatesEnabled(True)
+                stack.updateGeometry()
+        return widgets
+
+    def show_property_page(self, kind: str, algo_type: str) -> Dict[str, QWidget]:
+        """切换到识别算法/动作的属性页面，返回该页面的属性控件"""
+        widgets = self.get_property_widgets(kind, algo_type)
+        if (kind, algo_type) in self.stale_pages:
+            self.reset_property_page(kind, algo_type)
+        self.property_stacks[kind].setCurrentWidget(self.property_pages[(kind, algo_type)])
+        self.current_property_widgets[kind] = widgets
+        return widgets
+
+    def reset_property_page(self, kind: str, algo_type: str):
+        """将识别算法/动作的属性页面重置为默认值"""
+        self.stale_pages.discard((kind, algo_type))
+        widgets = self.property_widgets[(kind, algo_type)]
+        with self.batch_widget_updates(widgets.values()):
+            for prop_name, widget in widgets.items():
+                self.set_widget_value(widget, self.get_property_default(prop_name, algo_type))
 
     def connect_signals(self):
         """连接信号"""
-        # 识别算法和动作切换
-        self.widgets["recognition"].currentTextChanged.connect(self.on_recognition_changed)
-        self.widgets["action"].currentTextChanged.connect(self.on_action_changed)
+        # 分组展开时再创建折叠期间推迟的属性页面
+        for kind, (box_title, _, _) in self.PROPERTY_KINDS.items():
+            self.boxes[box_title].expanded_changed.connect(
+                lambda expanded, kind=kind: self.on_property_box_expanded(kind, expanded))
 
         # JSON标签页
         self.json_apply_button.clicked.connect(self.apply_json_to_node)
@@ -732,10 +980,20 @@ class NodePropertiesEditor(QWidget):
 
     def set_node(self, node=None):
         """设置要编辑的节点"""
+        # 切换节点前先发出上一个节点尚未发出的通知
+        if self.notify_timer.isActive():
+            self.notify_node_changed()
+
         if node is None:
             self.current_node = None
             self.show_no_node_view()
             return
+
+        # 重新选中正在编辑的节点时不重建控件，只刷新节点数据中变化的部分
+        if node is self.open_node and node.task_node is self.current_node:
+            self.sync_node_changes()
+            return
+
         self.open_node=node
         self.current_node = node.task_node
 
@@ -764,339 +1022,374 @@ class NodePropertiesEditor(QWidget):
             self.show_no_node_view()
             return
 
-        self.is_updating_ui = True
-        try:
-            # 更新基本属性
-            if hasattr(self.current_node, "name"):
-                self.widgets["name"].setText(self.current_node.name)
-
-            # 更新其他属性
-            for prop_name, widget in self.widgets.items():
-                value = self.get_node_value(prop_name)
-                self.set_widget_value(widget, value)
+        # 批量填充期间阻断信号并暂停重绘，结束后统一布局和绘制一次
+        with self.batch_widget_updates():
+            # 更新基本属性，每个属性只读取一次
+            values = {}
+            for lane in self.widget_lanes.values():
+                setter = _lookup_widget_handler(_WIDGET_SETTERS, lane[0][1])
+                for prop_name, widget in lane:
+                    value = self.get_node_value(prop_name)
+                    values[prop_name] = value
+                    setter(widget, value)
 
             # 更新算法特定属性
-            self.update_algorithm_properties()
+            self.update_algorithm_properties(values["recognition"], values["action"])
 
             # 更新预览
             self.update_preview_images()
 
             self.update_json_preview()
+
+            self.applied_snapshot = self.current_node.to_json()
+            self.dirty_widgets.clear()
+
+    def sync_node_changes(self):
+        """节点在其他视图中被修改后，只刷新发生变化的属性控件"""
+        node = self.current_node
+        if not node or self.applied_snapshot is None:
+            self.update_ui_from_node()
+            return
+
+        snapshot = node.to_json()
+        if snapshot == self.applied_snapshot:
+            return
+
+        (old_name, old_values), = json.loads(self.applied_snapshot).items()
+        new_values = node.to_dict()
+        changed = {key for key in old_values.keys() | new_values.keys()
+                   if old_values.get(key) != new_values.get(key)}
+
+        # 名称或类型变化会影响页面和默认值，仍然完整刷新
+        if node.name != old_name or not changed.isdisjoint(self.PROPERTY_KINDS):
+            self.update_ui_from_node()
+            return
+
+        targets = []
+        for widgets in (self.widgets, *self.current_property_widgets.values()):
+            targets.extend((prop_name, widgets[prop_name]) for prop_name in changed if prop_name in widgets)
+
+        with self.batch_widget_updates([widget for _, widget in targets]):
+            for prop_name, widget in targets:
+                self.set_widget_value(widget, self.get_node_value(prop_name))
+                self.dirty_widgets.discard(widget)
+
+            if "template" in changed:
+                self.update_preview_images()
+            self.update_json_preview()
+            self.applied_snapshot = snapshot
+
+    @contextmanager
+    def batch_widget_updates(self, widgets=None):
+        """批量填充控件：期间阻断控件信号（默认为全部控件）并暂停重绘"""
+        blockers = self.block_widget_signals(widgets)
+        # 嵌套使用时由最外层恢复重绘
+        pause_updates = self.updatesEnabled()
+        if pause_updates:
+            self.setUpdatesEnabled(False)
+        try:
+            yield
         finally:
-            self.is_updating_ui = False
+            if pause_updates:
+                self.setUpdatesEnabled(True)
+            self.unblock_widget_signals(blockers)
+
+    def block_widget_signals(self, widgets=None) -> List[QSignalBlocker]:
+        """阻断属性控件的信号（默认为全部控件），避免批量填充时触发连锁的变更处理"""
+        if widgets is not None:
+            return [QSignalBlocker(widget) for widget in widgets]
+
+        blockers = [QSignalBlocker(widget) for widget in self.widgets.values()]
+        for widgets in self.property_widgets.values():
+            blockers.extend(QSignalBlocker(widget) for widget in widgets.values())
+        return blockers
+
+    def unblock_widget_signals(self, blockers: List[QSignalBlocker]):
+        """恢复由block_widget_signals阻断的信号"""
+        for blocker in blockers:
+            blocker.unblock()
 
     def reset_all_widgets(self):
         """重置所有小部件到默认状态"""
-        self.is_updating_ui = True
-        try:
+        with self.batch_widget_updates():
             # Reset basic widgets
-            for prop_name, widget in self.widgets.items():
-                default_value = self.PROPERTY_DEFAULTS.get(prop_name)
-                self.set_widget_value(widget, default_value)
-
-            # Reset all algorithm-specific widgets
-            for algo_type, widgets in self.property_widgets.items():
-                for prop_name, widget in widgets.items():
-                    # Get algorithm-specific default if available
-                    if algo_type in self.ALGORITHM_DEFAULTS and prop_name in self.ALGORITHM_DEFAULTS[algo_type]:
-                        default_value = self.ALGORITHM_DEFAULTS[algo_type][prop_name]
-                    else:
-                        default_value = self.PROPERTY_DEFAULTS.get(prop_name)
-                    self.set_widget_value(widget, default_value)
-        finally:
-            self.is_updating_ui = False
+            for lane in self.widget_lanes.values():
+                setter = _lookup_widget_handler(_WIDGET_SETTERS, lane[0][1])
+                for prop_name, widget in lane:
+                    setter(widget, self.PROPERTY_DEFAULTS.get(prop_name))
 
-    def update_algorithm_properties(self):
-        """更新算法特定属性"""
-        rec_type = self.get_node_value("recognition")
-        if rec_type in self.recognition_types:
-            index = self.recognition_types.index(rec_type)
-            self.recognition_stack.setCurrentIndex(index)
+            # 算法特有属性页面只标记为待重置，等到再次显示时才重置
+            self.stale_pages = set(self.property_widgets)
+            self.pending_pages.clear()
+            self.dirty_widgets.clear()
 
-            # 更新该算法的属性
-            widgets = self.property_widgets.get(rec_type, {})
-            for prop_name, widget in widgets.items():
-                value = self.get_node_value(prop_name)
-                # 检查是否应该使用算法特定的默认值
-                if value is None and rec_type in self.ALGORITHM_DEFAULTS and prop_name in self.ALGORITHM_DEFAULTS[
-                    rec_type]:
-                    value = self.ALGORITHM_DEFAULTS[rec_type][prop_name]
-                self.set_widget_value(widget, value)
-
-        action_type = self.get_node_value("action")
-        if action_type in self.action_types:
-            index = self.action_types.index(action_type)
-            self.action_stack.setCurrentIndex(index)
-
-            # 更新该动作的属性
-            widgets = self.property_widgets.get(action_type, {})
+    def update_algorithm_properties(self, rec_type: str = None, action_type: str = None):
+        """更新算法特定属性"""
+        for kind, algo_type in (("recognition", rec_type), ("action", action_type)):
+            if algo_type is None:
+                algo_type = self.get_node_value(kind)
+            if algo_type not in self.property_specs[kind]:
+                self.pending_pages.pop(kind, None)
+                self.current_property_widgets.pop(kind, None)
+                continue
+
+            # 分组折叠时看不到页面，推迟到展开时再创建和填充
+            if not self.boxes[self.PROPERTY_KINDS[kind][0]].is_expanded():
+                self.pending_pages[kind] = algo_type
+                self.current_property_widgets.pop(kind, None)
+                continue
+
+            self.pending_pages.pop(kind, None)
+            self.load_property_page(kind, algo_type)
+
+    def load_property_page(self, kind: str, algo_type: str):
+        """显示识别算法/动作的属性页面并填入节点的值"""
+        # get_node_value已经处理了算法特定的默认值
+        widgets = self.show_property_page(kind, algo_type)
+        # 页面可能是刚创建的，不在外层已阻断信号的控件中
+        with self.batch_widget_updates(widgets.values()):
             for prop_name, widget in widgets.items():
-                value = self.get_node_value(prop_name)
-                self.set_widget_value(widget, value)
+                self.set_widget_value(widget, self.get_node_value(prop_name))
+
+    def on_property_box_expanded(self, kind: str, expanded: bool):
+        """识别算法/动作分组展开时，创建并填充之前推迟的页面"""
+        if not expanded or not self.current_node:
+            return
+        algo_type = self.pending_pages.pop(kind, None)
+        if algo_type is None:
+            return
+
+        self.load_property_page(kind, algo_type)
 
     def get_node_value(self, prop_name: str) -> Any:
         """获取节点属性值"""
-        if not self.current_node:
+        node = self.current_node
+        if not node:
             return self.PROPERTY_DEFAULTS.get(prop_name)
 
-        value = getattr(self.current_node, prop_name, None)
+        value = getattr(node, prop_name, None)
 
         # 如果属性值为None，检查是否有算法特定的默认值
         if value is None:
-            # 获取当前的识别算法类型
-            rec_type = getattr(self.current_node, "recognition", self.PROPERTY_DEFAULTS.get("recognition"))
-
-            # 检查是否有算法特定的默认值
-            if rec_type in self.ALGORITHM_DEFAULTS and prop_name in self.ALGORITHM_DEFAULTS[rec_type]:
-                return self.ALGORITHM_DEFAULTS[rec_type][prop_name]
-
-            # 否则返回全局默认值
-            return self.PROPERTY_DEFAULTS.get(prop_name)
+            # 获取当前的识别算法类型，优先使用算法特定的默认值，否则返回全局默认值
+            rec_type = getattr(node, "recognition", self.PROPERTY_DEFAULTS.get("recognition"))
+            return self.get_property_default(prop_name, rec_type)
 
         return value
 
     def get_property_default(self, prop_name: str, rec_type: str = None) -> Any:
         """获取属性的默认值，考虑识别算法特定的默认值"""
-        if rec_type and rec_type in self.ALGORITHM_DEFAULTS and prop_name in self.ALGORITHM_DEFAULTS[rec_type]:
-            return self.ALGORITHM_DEFAULTS[rec_type][prop_name]
+        algo_defaults = self.ALGORITHM_DEFAULTS.get(rec_type)
+        if algo_defaults is not None:
+            default = algo_defaults.get(prop_name)
+            if default is not None:
+                return default
         return self.PROPERTY_DEFAULTS.get(prop_name)
 
     def set_widget_value(self, widget: QWidget, value: Any):
         """设置widget值"""
-        if isinstance(widget, QLineEdit):
-            if isinstance(value, (list, dict)):
-                widget.setText(json.dumps(value, ensure_ascii=False))
-            elif value is True:
-                # 对于target, begin, end等特殊值，True表示使用默认值
-                widget.clear()
-            else:
-                widget.setText(str(value) if value is not None else "")
-
-        elif isinstance(widget, QTextEdit):
-            if isinstance(value, (list, dict)):
-                widget.setPlainText(json.dumps(value, indent=2, ensure_ascii=False))
-            else:
-                widget.setPlainText(str(value) if value is not None else "")
-
-        elif isinstance(widget, (QSpinBox, QDoubleSpinBox)):
-            if value is not None:
-                widget.setValue(value)
-
-        elif isinstance(widget, QComboBox):
-            if value:
-                index = widget.findText(str(value))
-                if index >= 0:
-                    widget.setCurrentIndex(index)
-
-        elif isinstance(widget, QCheckBox):
-            widget.setChecked(bool(value))
-
-        elif isinstance(widget, ListEditor):
-            widget.set_value(value or [])
+        setter = _lookup_widget_handler(_WIDGET_SETTERS, widget)
+        if setter:
+            setter(widget, value)
 
+    @Slot()
     def on_widget_changed(self):
         """处理widget变化"""
-        if self.is_updating_ui:
-            return
+        self.mark_widget_changed(self.sender())
+
+    def mark_widget_changed(self, widget: QWidget):
+        """记录被修改的控件，启用自动保存时按节流规则保存"""
+        self.dirty_widgets.add(widget)
 
         if self.auto_save:
-            QTimer.singleShot(300, self.apply_changes_silent)
+            clock = self.auto_save_clock
+            if not clock.isValid() or clock.elapsed() >= self.auto_save_timer.interval():
+                self.apply_changes_silent()
+            elif not self.auto_save_timer.isActive():
+                self.auto_save_timer.start()
 
+    @Slot(str)
     def on_recognition_changed(self, rec_type):
         """处理识别算法变化"""
-        if self.is_updating_ui:
-            return
-
-        # 先保存当前算法的所有已修改属性
-        old_rec_type = self.get_node_value("recognition")
-        if old_rec_type in self.property_widgets:
-            widgets = self.property_widgets.get(old_rec_type, {})
-            for prop_name, widget in widgets.items():
-                value = self.get_widget_value(widget)
-                # 保存非默认值的属性
-                default_value = self.get_property_default(prop_name, old_rec_type)
-                if value != default_value:
-                    self.save_node_property(prop_name, value)
-
-        # 然后切换到新算法
-        if rec_type in self.recognition_types:
-            index = self.recognition_types.index(rec_type)
-            self.recognition_stack.setCurrentIndex(index)
-            self.boxes["识别算法特有属性"].set_expanded(rec_type != "DirectHit")
-
-            # 更新为recognition类型
-            self.save_node_property("recognition", rec_type)
-
-            # 更新新算法的属性值
-            widgets = self.property_widgets.get(rec_type, {})
-            for prop_name, widget in widgets.items():
-                # 如果current_node中已有该属性值，则使用它
-                if hasattr(self.current_node, prop_name):
-                    value = getattr(self.current_node, prop_name)
-                    self.set_widget_value(widget, value)
-                else:
-                    # 否则使用算法特定的默认值
-                    if rec_type in self.ALGORITHM_DEFAULTS and prop_name in self.ALGORITHM_DEFAULTS[rec_type]:
-                        default_value = self.ALGORITHM_DEFAULTS[rec_type][prop_name]
-                        self.set_widget_value(widget, default_value)
-
-            # 算法变更后更新预览
-            self.update_preview_images()
+        self.switch_property_page("recognition", rec_type)
+        self.mark_widget_changed(self.widgets["recognition"])
 
+    @Slot(str)
     def on_action_changed(self, action_type):
         """处理动作类型变化"""
-        if self.is_updating_ui:
+        self.switch_property_page("action", action_type)
+        self.mark_widget_changed(self.widgets["action"])
+
+    def switch_property_page(self, kind: str, new_type: str):
+        """切换识别算法/动作类型：保存旧类型的属性，显示并填充新类型的属性"""
+        box_title, no_config_types, refresh_preview = self.PROPERTY_KINDS[kind]
+
+        # 先保存当前类型的所有已修改属性，未修改的控件与节点一致，不再重新解析文本
+        old_type = self.get_node_value(kind)
+        dirty = self.dirty_widgets
+        for prop_name, widget in self.current_property_widgets.get(kind, {}).items():
+            if widget not in dirty:
+                continue
+            dirty.discard(widget)
+            value = self.get_widget_value(widget)
+            # 保存非默认值的属性
+            if value != self.get_property_default(prop_name, old_type):
+                self.save_node_property(prop_name, value)
+
+        if new_type not in self.property_specs[kind]:
             return
 
-        # 先保存当前动作的所有已修改属性
-        old_action_type = self.get_node_value("action")
-        if old_action_type in self.property_widgets:
-            widgets = self.property_widgets.get(old_action_type, {})
-            for prop_name, widget in widgets.items():
-                value = self.get_widget_value(widget)
-                # 保存非默认值的属性
-                default_value = self.PROPERTY_DEFAULTS.get(prop_name)
-                if value != default_value:
-                    self.save_node_property(prop_name, value)
-
-        # 然后切换到新动作
-        if action_type in self.action_types:
-            index = self.action_types.index(action_type)
-            self.action_stack.setCurrentIndex(index)
-            self.boxes["执行动作特有属性"].set_expanded(action_type not in ["DoNothing", "StopTask"])
-
-            # 更新action类型
-            self.save_node_property("action", action_type)
-
-            # 更新新动作的属性值
-            widgets = self.property_widgets.get(action_type, {})
+        # 然后切换到新类型
+        self.pending_pages.pop(kind, None)
+        widgets = self.show_property_page(kind, new_type)
+        self.boxes[box_title].set_expanded(new_type not in no_config_types)
+        self.save_node_property(kind, new_type)
+
+        # 更新新类型的属性值，结束后只触发一次变更处理
+        node = self.current_node
+        with self.batch_widget_updates(widgets.values()):
             for prop_name, widget in widgets.items():
-                # 如果current_node中已有该属性值，则使用它
-                if hasattr(self.current_node, prop_name):
-                    value = getattr(self.current_node, prop_name)
-                    self.set_widget_value(widget, value)
+                # 如果current_node中已有该属性值，则使用它，否则使用默认值
+                if hasattr(node, prop_name):
+                    self.set_widget_value(widget, getattr(node, prop_name))
                 else:
-                    # 否则使用默认值
-                    default_value = self.PROPERTY_DEFAULTS.get(prop_name)
+                    default_value = self.get_property_default(prop_name, new_type)
                     if default_value is not None:
                         self.set_widget_value(widget, default_value)
 
-    def apply_changes(self):
-        """应用更改"""
-        if not self.current_node:
+        if refresh_preview:
+            self.update_preview_images()
+
+    @Slot()
+    def apply_changes(self, defer_notify: bool = False):
+        """应用更改，defer_notify为True时合并短时间内的通知"""
+        node = self.current_node
+        if not node:
             return
 
-        old_name = self.current_node.name  # 保存旧名称
-
-        # 更新所有属性
-        for prop_name, widget in self.widgets.items():
-            if prop_name == "name":
-                new_name = widget.text()
-                if new_name != old_name:
-                    self.current_node.name = new_name
-                    self.node_name_change.emit(old_name, new_name)  # 发出名称变更信号
-            else:
-                value = self.get_widget_value(widget)
-                self.save_node_property(prop_name, value)
+        # 先处理列表编辑器中延迟解析的输入，避免丢失最后一次按键
+        for _, widget in self.widget_lanes.get(ListEditor, ()):
+            widget.flush()
+
+        old_name = node.name  # 保存旧名称
+        new_name = self.widgets["name"].text()
+        if new_name != old_name:
+            node.name = new_name
+            self.node_name_change.emit(old_name, new_name)  # 发出名称变更信号
+
+        # 更新其余属性，未修改过的控件与节点一致，不再重新解析
+        dirty = self.dirty_widgets
+        if dirty:
+            ui_only = self.UI_ONLY_PROPERTIES
+            save = self.save_node_property
+            for lane in self.widget_lanes.values():
+                getter = _lookup_widget_handler(_WIDGET_GETTERS, lane[0][1])
+                for prop_name, widget in lane:
+                    if widget not in dirty or prop_name in ui_only:
+                        continue
+                    save(prop_name, getter(widget))
 
-        # 更新算法特定属性
-        self.save_algorithm_properties()
+            # 更新算法特定属性
+            self.save_algorithm_properties()
+            dirty.clear()
+
+        # 节点没有任何变化时不再刷新和通知其他视图
+        snapshot = node.to_json()
+        if snapshot == self.applied_snapshot:
+            return
+        self.applied_snapshot = snapshot
 
         # 更新预览
         self.update_preview_images()
 
+        if defer_notify:
+            if not self.notify_timer.isActive():
+                self.notify_timer.start()
+        else:
+            self.notify_node_changed()
+
+        self.show_status("✓ 节点属性已更新")
+
+    @Slot()
+    def notify_node_changed(self):
+        """刷新节点显示并通知其他视图"""
+        self.notify_timer.stop()
+        if self.open_node is None:
+            return
         self.open_node.refresh_ui()
 
         # self.node_changed.emit(self.current_node)
         self.OpenNodeChanged.emit("property_editor",self.open_node)
 
+    def show_status(self, message: str):
+        """在按钮栏显示提示信息，不阻塞界面"""
+        self.status_label.setText(message)
+        self.status_timer.start()
+
+    @Slot()
     def apply_changes_silent(self):
         """静默应用更改"""
-        self.apply_changes()
+        # 已经立即应用，不再需要等待中的自动保存
+        self.auto_save_timer.stop()
+        self.auto_save_clock.start()
+        self.apply_changes(defer_notify=True)
 
     def save_algorithm_properties(self):
         """保存算法特定属性"""
+        node = self.current_node
         # 保存识别算法属性
-        rec_type = self.get_node_value("recognition")
-        widgets = self.property_widgets.get(rec_type, {})
+        algo_defaults = self.ALGORITHM_DEFAULTS.get(self.get_node_value("recognition"), {})
+        widgets = self.current_property_widgets.get("recognition", {})
         for prop_name, widget in widgets.items():
+            if widget not in self.dirty_widgets:
+                continue
             value = self.get_widget_value(widget)
             # 如果属性值与算法特定的默认值相同，就不保存
-            if rec_type in self.ALGORITHM_DEFAULTS and prop_name in self.ALGORITHM_DEFAULTS[rec_type]:
-                if value == self.ALGORITHM_DEFAULTS[rec_type][prop_name]:
-                    # 如果属性值已经存在但等于默认值，则删除该属性
-                    if hasattr(self.current_node, prop_name):
-                        delattr(self.current_node, prop_name)
-                    continue
+            default = algo_defaults.get(prop_name)
+            if default is not None and value == default:
+                # 如果属性值已经存在但等于默认值，则删除该属性
+                if hasattr(node, prop_name):
+                    delattr(node, prop_name)
+                continue
             self.save_node_property(prop_name, value)
 
         # 保存动作属性
-        action_type = self.get_node_value("action")
-        widgets = self.property_widgets.get(action_type, {})
+        widgets = self.current_property_widgets.get("action", {})
         for prop_name, widget in widgets.items():
+            if widget not in self.dirty_widgets:
+                continue
             value = self.get_widget_value(widget)
             self.save_node_property(prop_name, value)
 
     def get_widget_value(self, widget: QWidget) -> Any:
         """获取widget的值"""
-        if isinstance(widget, QLineEdit):
-            text = widget.text().strip()
-            if text:
-                # 处理特殊值(target, begin, end)
-                if text in ["target", "begin", "end"] and not text.startswith("["):
-                    return True
-
-                try:
-                    if text.startswith(("[", "{")):
-                        return json.loads(text)
-                    # 尝试解析为整数
-                    return int(text)
-                except:
-                    return text
-
-        elif isinstance(widget, QTextEdit):
-            text = widget.toPlainText().strip()
-            if text:
-                try:
-                    return json.loads(text)
-                except:
-                    return text  # 如果JSON解析失败，返回原始文本而不是None
-
-        elif isinstance(widget, (QSpinBox, QDoubleSpinBox)):
-            return widget.value()
-
-        elif isinstance(widget, QComboBox):
-            return widget.currentText()
-
-        elif isinstance(widget, QCheckBox):
-            return widget.isChecked()
-
-        elif isinstance(widget, ListEditor):
-            return widget.get_value()
-
-        return None
+        getter = _lookup_widget_handler(_WIDGET_GETTERS, widget)
+        return getter(widget) if getter else None
 
     def save_node_property(self, prop_name: str, value: Any):
         """保存属性到节点"""
-        if not self.current_node:
+        node = self.current_node
+        if not node:
             return
 
         # 获取该属性的默认值（考虑算法特定默认值）
-        rec_type = getattr(self.current_node, "recognition", self.PROPERTY_DEFAULTS["recognition"])
+        rec_type = getattr(node, "recognition", self.PROPERTY_DEFAULTS["recognition"])
         default = self.get_property_default(prop_name, rec_type)
 
         if value == default:
-            if hasattr(self.current_node, prop_name):
-                delattr(self.current_node, prop_name)
+            if hasattr(node, prop_name):
+                delattr(node, prop_name)
         else:
-            setattr(self.current_node, prop_name, value)
+            setattr(node, prop_name, value)
 
+    @Slot()
     def reset_form(self):
         """重置表单"""
         if self.current_node:
             self.update_ui_from_node()
-            QMessageBox.information(self, "提示", "表单已重置")
+            self.show_status("表单已重置")
 
+    @Slot(int)
     def on_tab_changed(self, index):
         """标签页切换"""
         if index == 1:  # 预览标签页
@@ -1104,20 +1397,28 @@ class NodePropertiesEditor(QWidget):
         elif index == 2:  # JSON标签页
             self.update_json_preview()
 
+    @Slot()
     def update_json_preview(self):
         """更新JSON预览"""
         if not self.current_node:
             return
 
         try:
+            snapshot = self.current_node.to_json()
+            if snapshot == self.json_preview_snapshot and not self.json_editor.document().isModified():
+                self.json_error_banner.hide()
+                return
+
             # 生成JSON时使用ensure_ascii=False以正确显示中文字符
             json_text = self.current_node.to_json(indent=4)
             self.json_editor.setPlainText(json_text)
+            self.json_preview_snapshot = snapshot
             self.json_error_banner.hide()
         except Exception as e:
             self.json_error_banner.setText(f"更新预览失败: {str(e)}")
             self.json_error_banner.show()
 
+    @Slot()
     def apply_json_to_node(self):
         """应用JSON到节点"""
         if not self.current_node:
@@ -1143,25 +1444,24 @@ class NodePropertiesEditor(QWidget):
 
     def update_preview_images(self):
         """更新预览图像"""
+        node = self.current_node
         # 清除现有图片（保留添加按钮）
         self.image_preview_container.clear_images()
 
-        if not self.current_node:
+        if not node:
             return
 
         # 获取识别算法类型
         recognition_type = self.get_node_value("recognition")
 
-        # 需要预览图片的算法类型
-        image_based_algorithms = ["TemplateMatch", "FeatureMatch"]
-
-        if recognition_type not in image_based_algorithms:
+        # 只有基于图片的算法需要预览
+        if recognition_type not in self.IMAGE_BASED_RECOGNITIONS:
             return
 
         # 获取模板路径
         templates = []
-        if hasattr(self.current_node, 'template'):
-            template_value = self.current_node.template
+        if hasattr(node, 'template'):
+            template_value = node.template
             if isinstance(template_value, list):
                 templates = template_value
             elif isinstance(template_value, str) and template_value:
@@ -1179,12 +1479,14 @@ class NodePropertiesEditor(QWidget):
                 # 传递相对路径作为额外参数
                 self.image_preview_container.add_image(final_path, template_path)
 
+    @Slot(str)
     def on_template_image_deleted(self, relative_path):
         """处理模板图片删除"""
-        if not self.current_node or not hasattr(self.current_node, 'template'):
+        node = self.current_node
+        if not node or not hasattr(node, 'template'):
             return
 
-        template_value = self.current_node.template
+        template_value = node.template
 
         # 从template属性中移除对应的路径
         if isinstance(template_value, list):
@@ -1192,26 +1494,16 @@ class NodePropertiesEditor(QWidget):
                 template_value.remove(relative_path)
                 # 如果列表为空，将template设为None或空字符串
                 if not template_value:
-                    delattr(self.current_node, 'template')
+                    delattr(node, 'template')
                 elif len(template_value) == 1:
                     # 如果只剩一个元素，可以转换为字符串
-                    self.current_node.template = template_value[0]
+                    node.template = template_value[0]
         elif isinstance(template_value, str) and template_value == relative_path:
             # 如果是字符串且匹配，删除属性
-            delattr(self.current_node, 'template')
+            delattr(node, 'template')
 
         # 更新UI中的template输入框
-        recognition_type = self.get_node_value("recognition")
-        if recognition_type in self.property_widgets and "template" in self.property_widgets[recognition_type]:
-            template_widget = self.property_widgets[recognition_type]["template"]
-            if hasattr(self.current_node, 'template'):
-                template_value = self.current_node.template
-                if isinstance(template_value, list):
-                    template_widget.setText(json.dumps(template_value))
-                else:
-                    template_widget.setText(str(template_value))
-            else:
-                template_widget.clear()
+        self.refresh_template_widget()
 
         # 如果启用了自动保存，应用更改
         if self.auto_save:
@@ -1220,6 +1512,7 @@ class NodePropertiesEditor(QWidget):
         # 发出节点变更信号
         self.OpenNodeChanged.emit("property_editor", self.open_node)
 
+    @Slot(bool)
     def toggle_auto_save(self, checked):
         """切换自动保存"""
         self.auto_save = checked
@@ -1227,6 +1520,8 @@ class NodePropertiesEditor(QWidget):
 
         if checked:
             self.apply_changes_silent()
+        else:
+            self.auto_save_timer.stop()
 
     @Slot(str, object)
     def node_property_change(self, prop_name, value):
@@ -1250,23 +1545,28 @@ class NodePropertiesEditor(QWidget):
 
     def _update_template(self, new_template):
         """专门处理模板更新的辅助方法"""
-        current_template = getattr(self.current_node, "template", None)
+        node = self.current_node
+        current_template = getattr(node, "template", None)
 
         if current_template is None:
-            self.current_node.template = [new_template]
+            node.template = [new_template]
         elif isinstance(current_template, list):
             if new_template not in current_template:  # 避免重复添加
                 current_template.append(new_template)
         elif isinstance(current_template, str):
             if current_template != new_template:  # 避免重复添加
-                self.current_node.template = [current_template, new_template]
+                node.template = [current_template, new_template]
         else:
-            self.current_node.template = [new_template]
+            node.template = [new_template]
 
         # 如果你有UI控件专门显示template值的，也应该在这里更新
-        if "template" in self.property_widgets.get(self.current_node.recognition, {}):
-            template_widget = self.property_widgets[self.current_node.recognition]["template"]
-            if isinstance(self.current_node.template, list):
-                template_widget.setText(json.dumps(self.current_node.template))
-            else:
-                template_widget.setText(str(self.current_node.template))
\ No newline at end of file
+        self.refresh_template_widget()
+
+    def refresh_template_widget(self):
+        """按节点的template属性刷新模板输入框，与其他控件使用相同的格式，且不视为用户修改"""
+        template_widget = self.current_property_widgets.get("recognition", {}).get("template")
+        if template_widget is None:
+            return
+        with self.batch_widget_updates((template_widget,)):
+            self.set_widget_value(template_widget, getattr(self.current_node, "template", None))
+        self.dirty_widgets.discard(template_widget)
\ No newline at end of file